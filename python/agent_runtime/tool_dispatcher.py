@@ -33,6 +33,8 @@ class ToolDispatcher:
         """Initialize the tool dispatcher."""
         self.tools: dict[str, Callable] = {}
         self.schemas: dict[str, ToolSchema] = {}
+        # export_schemas_json() result; reset whenever the tool set changes
+        self._schemas_json: str | None = None
 
         logger.info("Initialized ToolDispatcher")
 
@@ -63,6 +65,7 @@ class ToolDispatcher:
 
         self.tools[name] = function
         self.schemas[name] = schema
+        self._schemas_json = None
 
         logger.info(f"Registered tool: {name}")
 
@@ -71,6 +74,7 @@ class ToolDispatcher:
         if name in self.tools:
             del self.tools[name]
             del self.schemas[name]
+            self._schemas_json = None
             logger.info(f"Unregistered tool: {name}")
 
     def execute_tool(self, name: str, parameters: dict[str, Any]) -> dict[str, Any]:
@@ -151,9 +155,15 @@ class ToolDispatcher:
         """
         Export all tool schemas as JSON for LLM function calling.
 
+        The string is built once and reused until a tool is registered or
+        unregistered, since agents include it in every prompt.
+
         Returns:
             JSON string of all tool schemas
         """
+        if self._schemas_json is not None:
+            return self._schemas_json
+
         schemas = []
         for schema in self.schemas.values():
             schemas.append(
@@ -165,4 +175,5 @@ class ToolDispatcher:
                 }
             )
 
-        return json.dumps(schemas, indent=2)
+        self._schemas_json = json.dumps(schemas, indent=2)
+        return self._schemas_json
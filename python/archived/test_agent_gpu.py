@@ -11,6 +11,7 @@ This test demonstrates:
 
 import json
 import logging
+import re
 
 from agent_runtime.agent import Action, Agent
 from agent_runtime.tool_dispatcher import ToolDispatcher
@@ -22,6 +23,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Resource types the mock collect_resource tool accepts
+_VALID_RESOURCES = frozenset(("wood", "stone", "food"))
+
+# Patterns used by EnhancedAgent._extract_json to repair LLM output.
+# Missing comma between fields: "value"\n"field" should be "value",\n"field"
+_MISSING_COMMA_RE = re.compile(r'([\d"])\s*\n\s*("(?:reasoning|tool|params))')
+_TOOL_RE = re.compile(r'"tool"\s*:\s*"([^"]+)"')
+_RESOURCE_RE = re.compile(r'"resource_name"\s*:\s*"([^"]+)"')
+_TARGET_X_RE = re.compile(r'"target_x"\s*:\s*([\d.]+)')
+_TARGET_Y_RE = re.compile(r'"target_y"\s*:\s*([\d.]+)')
+
 
 # ============================================================
 # Step 1: Create Sample Tools
@@ -75,8 +89,7 @@ def create_tool_dispatcher() -> ToolDispatcher:
     # Tool 2: Collect resource
     def collect_resource(resource_name: str) -> dict:
         """Collect a resource from the environment."""
-        valid_resources = ["wood", "stone", "food"]
-        if resource_name in valid_resources:
+        if resource_name in _VALID_RESOURCES:
             return {
                 "success": True,
                 "message": f"Collected {resource_name}",
@@ -207,8 +220,6 @@ Your response (JSON only): [/INST]"""
 
     def _extract_json(self, text: str) -> str:
         """Extract JSON object from text that might contain extra content."""
-        import re
-
         # Try to find JSON object in the response
         start = text.find("{")
         end = text.rfind("}")
@@ -216,18 +227,16 @@ Your response (JSON only): [/INST]"""
         if start != -1 and end != -1:
             json_str = text[start : end + 1]
 
-            # Try to validate and return if valid
+            # Decode the first complete object in one pass; trailing text
+            # after it (or a stray "}" in that text) is ignored.
             try:
-                json.loads(json_str)
-                return json_str
+                _, obj_end = _JSON_DECODER.raw_decode(text, start)
+                return text[start:obj_end]
             except json.JSONDecodeError as e:
                 logger.debug(f"JSON parse error: {e}")
 
                 # Common issue: missing comma between fields
-                # Pattern: "value"\n"field" should be "value",\n"field"
-                fixed_json = re.sub(
-                    r'([\d"])\s*\n\s*("(?:reasoning|tool|params))', r"\1,\n\2", json_str
-                )
+                fixed_json = _MISSING_COMMA_RE.sub(r"\1,\n\2", json_str)
 
                 try:
                     json.loads(fixed_json)
@@ -235,10 +244,10 @@ Your response (JSON only): [/INST]"""
                     return fixed_json
                 except json.JSONDecodeError:
                     # Fallback: extract key-value pairs manually
-                    tool_match = re.search(r'"tool"\s*:\s*"([^"]+)"', text)
-                    resource_match = re.search(r'"resource_name"\s*:\s*"([^"]+)"', text)
-                    target_x_match = re.search(r'"target_x"\s*:\s*([\d.]+)', text)
-                    target_y_match = re.search(r'"target_y"\s*:\s*([\d.]+)', text)
+                    tool_match = _TOOL_RE.search(text)
+                    resource_match = _RESOURCE_RE.search(text)
+                    target_x_match = _TARGET_X_RE.search(text)
+                    target_y_match = _TARGET_Y_RE.search(text)
 
                     if tool_match:
                         tool = tool_match.group(1)
@@ -18,6 +18,32 @@ from sentence_transformers import SentenceTransformer
 logger = logging.getLogger(__name__)
 
 
+def _score_and_filter(
+    distances: np.ndarray,
+    indices: np.ndarray,
+    is_ip: bool,
+    threshold: float | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert one row of FAISS distances to scores and build the valid-result mask.
+
+    Args:
+        distances: Distances returned by index.search for a single query, shape (k,)
+        indices: Matching FAISS ids, shape (k,); -1 marks "not found"
+        is_ip: True if distances are inner products (already similarities)
+        threshold: Optional minimum score
+
+    Returns:
+        (scores, valid) arrays of shape (k,). Scores are higher-is-better:
+        inner products are used as-is, L2 distances become 1 / (1 + d).
+    """
+    scores = distances if is_ip else 1.0 / (1.0 + distances)
+    valid = indices != -1
+    if threshold is not None:
+        valid &= scores >= threshold
+    return scores, valid
+
+
 class LongTermMemory:
     """
     Vector-based long-term memory with FAISS for episodic storage and retrieval.
@@ -53,6 +79,8 @@ class LongTermMemory:
         embedding_dim: int | None = None,
         index_type: str = "Flat",
         persist_path: str | None = None,
+        use_gpu: bool = False,
+        gpu_id: int = 0,
     ):
         """
         Initialize the long-term memory system.
@@ -62,6 +90,9 @@ class LongTermMemory:
             embedding_dim: Dimension of embeddings (auto-detected if None)
             index_type: Type of FAISS index ("Flat", "IVF", etc.)
             persist_path: Path to persist memory index to disk
+            use_gpu: Move the FAISS index to a GPU (requires the faiss-gpu wheel;
+                falls back to CPU with a warning if unavailable)
+            gpu_id: CUDA device to place the index on when use_gpu is True
 
         Raises:
             ValueError: If embedding_model is invalid or index_type is unsupported
@@ -69,6 +100,10 @@ class LongTermMemory:
         self.embedding_model_name = embedding_model
         self.index_type = index_type
         self.persist_path = persist_path
+        self.use_gpu = use_gpu
+        self.gpu_id = gpu_id
+        self._gpu_resources: Any = None
+        self.search_params: str | None = None  # Operating point chosen by autotune()
 
         # Initialize embedding model
         try:
@@ -111,8 +146,35 @@ class LongTermMemory:
         else:
             raise ValueError(f"Unsupported index type: {self.index_type}")
 
+        self.index = self._maybe_to_gpu(self.index)
         logger.debug(f"Initialized FAISS index: {self.index_type}")
 
+    def _maybe_to_gpu(self, index: Any) -> Any:
+        """
+        Move a CPU index onto the configured GPU if use_gpu is enabled.
+
+        GPU support lives in the separate faiss-gpu wheel, so this degrades to
+        the CPU index (and disables use_gpu) when it isn't installed.
+        """
+        if not self.use_gpu:
+            return index
+
+        try:
+            if self._gpu_resources is None:
+                self._gpu_resources = faiss.StandardGpuResources()
+            return faiss.index_cpu_to_gpu(self._gpu_resources, self.gpu_id, index)
+        except (AttributeError, RuntimeError) as e:
+            logger.warning(f"FAISS GPU support unavailable, using CPU index: {e}")
+            self.use_gpu = False
+            self._gpu_resources = None
+            return index
+
+    def _cpu_index(self) -> Any:
+        """Return a CPU copy of the index (GPU indices can't be serialized directly)."""
+        if self.use_gpu:
+            return faiss.index_gpu_to_cpu(self.index)
+        return self.index
+
     def store_memory(self, text: str, metadata: dict[str, Any] | None = None) -> str:
         """
         Store a memory with text and optional metadata.
@@ -133,13 +195,8 @@ class LongTermMemory:
         # Generate unique ID
         memory_id = str(uuid.uuid4())
 
-        # Generate embedding
-        embedding = self.encoder.encode(text, convert_to_numpy=True)
-        embedding = np.array(embedding, dtype=np.float32).reshape(1, -1)
-
-        # Normalize for cosine similarity if using FlatIP
-        if self.index_type == "FlatIP":
-            faiss.normalize_L2(embedding)
+        # Generate embedding (already unit-length for FlatIP)
+        embedding = self._encode([text])
 
         # Train IVF index if needed
         if self.index_type.startswith("IVF") and not self.index.is_trained:
@@ -213,51 +270,112 @@ class LongTermMemory:
             logger.warning("No memories stored, returning empty results")
             return []
 
-        # Generate query embedding
-        query_embedding = self.encoder.encode(query, convert_to_numpy=True)
-        query_embedding = np.array(query_embedding, dtype=np.float32).reshape(1, -1)
-
-        # Normalize for cosine similarity if using FlatIP
-        if self.index_type == "FlatIP":
-            faiss.normalize_L2(query_embedding)
+        # Generate query embedding (already unit-length for FlatIP)
+        query_embedding = self._encode([query])
 
         # Search FAISS index
         k = min(k, len(self.memories))  # Can't retrieve more than stored
         distances, indices = self.index.search(query_embedding, k)
 
-        # Build results
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx == -1:  # FAISS returns -1 for not found
-                continue
+        results = self._build_results(distances[0], indices[0], threshold)
 
-            memory_id = self.memory_ids[idx]
-            memory = self.memories[memory_id]
+        logger.debug(f"Query '{query[:30]}...' returned {len(results)} results")
+        return results
 
-            # Calculate score (higher is better)
-            # For L2 distance: convert to similarity score
-            # For IP (cosine): distance is already similarity
-            if self.index_type == "FlatIP":
-                score = float(dist)  # Already a similarity score [0, 1]
-            else:
-                # Convert L2 distance to similarity (inverse)
-                score = 1.0 / (1.0 + float(dist))
+    def query_memory_batch(
+        self,
+        queries: list[str],
+        k: int = 5,
+        threshold: float | None = None,
+        batch_size: int = 32,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Query memories for several texts at once.
+
+        All queries are embedded in a single encoder call and searched with a
+        single FAISS search over the (B, d) matrix, which is much cheaper than
+        calling query_memory() B times when several agents query together.
+
+        Args:
+            queries: Query texts to search for
+            k: Number of top results to return per query
+            threshold: Optional similarity threshold (only for FlatIP/cosine similarity)
+            batch_size: Encoder batch size
+
+        Returns:
+            One result list per query, in the same order as queries. Each list has
+            the same structure as query_memory() results.
+
+        Example:
+            >>> batches = memory.query_memory_batch(["berries", "water"], k=3)
+            >>> for query_results in batches:
+            ...     print([r['text'] for r in query_results])
+        """
+        if not queries:
+            return []
+
+        if len(self.memories) == 0:
+            logger.warning("No memories stored, returning empty results")
+            return [[] for _ in queries]
+
+        # Generate all query embeddings at once (already unit-length for FlatIP)
+        query_embeddings = self._encode(queries, batch_size=batch_size)
+
+        # Search FAISS index once for the whole batch
+        k = min(k, len(self.memories))  # Can't retrieve more than stored
+        distances, indices = self.index.search(query_embeddings, k)
+
+        results = [
+            self._build_results(distances[row], indices[row], threshold)
+            for row in range(len(queries))
+        ]
+
+        logger.debug(
+            f"Batch query of {len(queries)} texts returned {sum(map(len, results))} results"
+        )
+        return results
 
-            # Apply threshold if specified
-            if threshold is not None and score < threshold:
-                continue
+    def _encode(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Embed texts as a contiguous float32 (n, d) matrix ready for FAISS.
 
+        For FlatIP the encoder normalizes inside its pooling step, so inner
+        product equals cosine similarity without a separate normalize_L2 pass.
+        """
+        embeddings = self.encoder.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=self.index_type == "FlatIP",
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+
+    def _build_results(
+        self,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        threshold: float | None,
+    ) -> list[dict[str, Any]]:
+        """Turn one row of FAISS search output into result dictionaries."""
+        # Score (higher is better) and filter in one vectorized pass.
+        # For IP (cosine) the distance is already a similarity; L2 is inverted.
+        scores, valid = _score_and_filter(
+            distances, indices, self.index_type == "FlatIP", threshold
+        )
+
+        results = []
+        for i in np.flatnonzero(valid):
+            memory_id = self.memory_ids[indices[i]]
+            memory = self.memories[memory_id]
             results.append(
                 {
                     "id": memory_id,
                     "text": memory["text"],
                     "metadata": memory["metadata"],
-                    "score": score,
-                    "distance": float(dist),
+                    "score": float(scores[i]),
+                    "distance": float(distances[i]),
                 }
             )
-
-        logger.debug(f"Query '{query[:30]}...' returned {len(results)} results")
         return results
 
     def recall_by_id(self, memory_id: str) -> dict[str, Any] | None:
@@ -311,9 +429,87 @@ class LongTermMemory:
         """
         self.memories.clear()
         self.memory_ids.clear()
+        self.search_params = None
         self._init_index()
         logger.info("Cleared all memories")
 
+    def autotune(
+        self,
+        queries: np.ndarray,
+        gt: np.ndarray | None = None,
+        target_recall: float = 0.95,
+        k: int = 5,
+    ) -> str:
+        """
+        Pick the fastest search parameters (e.g. IVF nprobe) that reach a target recall.
+
+        Sweeps the speed/recall frontier with FAISS's ParameterSpace and applies
+        the fastest operating point whose recall is at least target_recall. If no
+        point reaches the target, the highest-recall point is used instead. The
+        chosen parameter string is persisted by save() and re-applied by load().
+
+        Args:
+            queries: Query embeddings, shape (nq, embedding_dim)
+            gt: Ground-truth neighbor indices, shape (nq, R). If None, exact
+                neighbors are computed by brute force over the stored embeddings.
+            target_recall: Minimum recall (intersection@R) to accept
+            k: Number of neighbors to compute when gt is None
+
+        Returns:
+            The applied parameter string (e.g. "nprobe=16"), or "" if the index
+            has no tunable parameters
+
+        Raises:
+            ValueError: If no memories are stored
+
+        Example:
+            >>> queries = memory.encoder.encode(["berries", "water"], convert_to_numpy=True)
+            >>> memory.autotune(queries, target_recall=0.9)
+            'nprobe=8'
+        """
+        if self.index.ntotal == 0:
+            raise ValueError("Cannot autotune an empty index")
+
+        queries = np.ascontiguousarray(queries, dtype=np.float32).reshape(-1, self.embedding_dim)
+        if self.index_type == "FlatIP":
+            faiss.normalize_L2(queries)
+
+        if gt is None:
+            exact = (
+                faiss.IndexFlatIP(self.embedding_dim)
+                if self.index_type == "FlatIP"
+                else faiss.IndexFlatL2(self.embedding_dim)
+            )
+            exact.add(np.stack([self.memories[mid]["embedding"] for mid in self.memory_ids]))
+            _, gt = exact.search(queries, min(k, exact.ntotal))
+        gt = np.ascontiguousarray(gt, dtype=np.int64)
+
+        criterion = faiss.IntersectionCriterion(len(queries), gt.shape[1])
+        criterion.set_groundtruth(None, gt)
+
+        param_space = faiss.GpuParameterSpace() if self.use_gpu else faiss.ParameterSpace()
+        param_space.initialize(self.index)
+        if param_space.n_combinations() <= 1:
+            logger.debug(f"Index {self.index_type} has no tunable search parameters")
+            return ""
+
+        # Keep a reference to the OperatingPoints; optimal_pts is a view into it.
+        # Points are sorted by increasing recall and search time.
+        operating_points = param_space.explore(self.index, queries, criterion)
+        optimal = operating_points.optimal_pts
+        points = [optimal.at(i) for i in range(optimal.size())]
+        chosen = next((op for op in points if op.perf >= target_recall), points[-1])
+        if chosen.perf < target_recall:
+            logger.warning(
+                f"No operating point reached recall {target_recall:.2f}; "
+                f"using best available ({chosen.perf:.2f})"
+            )
+
+        param_space.set_index_parameters(self.index, chosen.key)
+        self.search_params = chosen.key
+        logger.info(f"Autotuned search parameters: '{chosen.key}' (recall={chosen.perf:.3f})")
+        return chosen.key
+
     def save(self, filepath: str | None = None) -> None:
         """
         Save the memory index and data to disk.
@@ -336,14 +532,25 @@ class LongTermMemory:
 
         # Save FAISS index
         index_path = str(path.with_suffix(".index"))
-        faiss.write_index(self.index, index_path)
-
-        # Save memory metadata (without embeddings to save space)
+        faiss.write_index(self._cpu_index(), index_path)
+
+        # Save embeddings as a side-car .npy (rows follow memory_ids) so load()
+        # can memory-map them instead of re-encoding every memory
+        embeddings = np.empty((len(self.memory_ids), self.embedding_dim), dtype=np.float32)
+        for row, mem_id in enumerate(self.memory_ids):
+            embeddings[row] = self.memories[mem_id]["embedding"]
+            # Drop references to any memory-mapped file from a previous load();
+            # Windows refuses to overwrite a file that is still mapped
+            self.memories[mem_id]["embedding"] = embeddings[row]
+        np.save(path.with_suffix(".embs.npy"), embeddings)
+
+        # Save memory metadata (embeddings live in the .embs.npy file)
         metadata_path = str(path.with_suffix(".metadata"))
         metadata = {
             "embedding_model": self.embedding_model_name,
             "embedding_dim": self.embedding_dim,
             "index_type": self.index_type,
+            "search_params": self.search_params,
             "memory_ids": self.memory_ids,
             "memories": {
                 mem_id: {"id": mem["id"], "text": mem["text"], "metadata": mem["metadata"]}
@@ -382,7 +589,7 @@ class LongTermMemory:
         if not Path(index_path).exists():
             raise FileNotFoundError(f"Index file not found: {index_path}")
 
-        self.index = faiss.read_index(index_path)
+        self.index = self._maybe_to_gpu(faiss.read_index(index_path))
 
         # Load metadata
         if not Path(metadata_path).exists():
@@ -404,14 +611,35 @@ class LongTermMemory:
                 f"{metadata['embedding_dim']} vs {self.embedding_dim}"
             )
 
-        # Restore memories (regenerate embeddings if needed)
+        # Re-apply autotuned search parameters (absent in older metadata files)
+        self.search_params = metadata.get("search_params")
+        if self.search_params:
+            param_space = faiss.GpuParameterSpace() if self.use_gpu else faiss.ParameterSpace()
+            param_space.set_index_parameters(self.index, self.search_params)
+
+        # Restore memories. Embeddings are memory-mapped from the side-car file
+        # when present; older saves without it fall back to re-encoding.
         self.memory_ids = metadata["memory_ids"]
         self.memories = {}
 
+        embeddings_path = path.with_suffix(".embs.npy")
+        embeddings = None
+        if embeddings_path.exists():
+            embeddings = np.load(embeddings_path, mmap_mode="r")
+            if embeddings.shape != (len(self.memory_ids), self.embedding_dim):
+                logger.warning(
+                    f"Ignoring {embeddings_path}: shape {embeddings.shape} does not match "
+                    f"{len(self.memory_ids)} memories of dim {self.embedding_dim}"
+                )
+                embeddings = None
+        row_by_id = {mem_id: row for row, mem_id in enumerate(self.memory_ids)}
+
         for mem_id, mem_data in metadata["memories"].items():
-            # Regenerate embedding from text
-            embedding = self.encoder.encode(mem_data["text"], convert_to_numpy=True)
-            embedding = np.array(embedding, dtype=np.float32)
+            if embeddings is not None:
+                embedding = embeddings[row_by_id[mem_id]]
+            else:
+                # Regenerate embedding from text
+                embedding = self._encode([mem_data["text"]])[0]
 
             self.memories[mem_id] = {
                 "id": mem_data["id"],
@@ -150,6 +150,27 @@ class SemanticMemory(Generic[T]):
         """
         return self.long_term_memory.query_memory(query_text, k, threshold)
 
+    def query_batch(
+        self, query_texts: list[str], k: int = 5, threshold: float | None = None
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Query semantic memory with several texts in one encoder/index call.
+
+        Args:
+            query_texts: Natural language queries
+            k: Number of results to return per query
+            threshold: Optional similarity threshold
+
+        Returns:
+            One result list per query, in the same order as query_texts
+
+        Example:
+            >>> batches = memory.query_batch(["find errors", "slow requests"], k=5)
+            >>> for results in batches:
+            ...     print(len(results))
+        """
+        return self.long_term_memory.query_memory_batch(query_texts, k, threshold)
+
     def query_objects(self, query_text: str, k: int = 5, threshold: float | None = None) -> list[T]:
         """
         Query semantic memory and reconstruct typed objects.
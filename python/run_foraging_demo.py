@@ -6,22 +6,26 @@ It demonstrates the new "learner owns the code" approach.
 
 To run:
 1. Start this script: python run_foraging_demo.py
+   (or python run_foraging_demo.py --starter beginner for the rule-based agent)
 2. Open Godot and load foraging.tscn
 3. Press SPACE to start the simulation
 
-NOTE: This demo uses the beginner starter as an example.
+NOTE: This demo uses the LLM starter by default.
       For your own agents, copy a starter from starters/ directory.
 """
 
+import argparse
+import importlib.util
 import logging
 import sys
 from pathlib import Path
+from types import ModuleType
 
-# Add starters to path so we can import from them
-sys.path.insert(0, str(Path(__file__).parent.parent / "starters" / "llm"))
+from agent_arena_sdk import AgentArena
 
-from agent import Agent  # noqa: E402
-from agent_arena_sdk import AgentArena  # noqa: E402
+PROJECT_ROOT = Path(__file__).parent.parent
+STARTERS_DIR = PROJECT_ROOT / "starters"
+DEMO_MODEL = "qwen2.5-14b-instruct"
 
 # Configure logging
 logging.basicConfig(
@@ -31,8 +35,87 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def load_starter(starter: str) -> ModuleType:
+    """
+    Import ``starters/<starter>/agent.py`` as the module ``<starter>_starter_agent``.
+
+    Loading by file path under a unique name keeps the starter's ``agent``
+    module from shadowing (or being shadowed by) any other ``agent`` module.
+    The starter folder is still put on sys.path because starters are meant
+    to be copied and run on their own, so they import their siblings
+    (``memory``, ``llm_client``) as top-level modules.
+    """
+    starter_dir = STARTERS_DIR / starter
+    if str(starter_dir) not in sys.path:
+        sys.path.insert(0, str(starter_dir))
+
+    name = f"{starter}_starter_agent"
+    spec = importlib.util.spec_from_file_location(name, starter_dir / "agent.py")
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load starter agent from {starter_dir}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_model(quant: str) -> str:
+    """
+    Resolve the demo model's GGUF file for a quantization, or pick one with 'auto'.
+
+    Falls back to the Q4_K_M path (what the model manager downloads by default)
+    when the requested file is not cached, so the load error names a real path.
+    """
+    from tools.model_manager import ModelManager
+
+    manager = ModelManager(
+        models_dir=PROJECT_ROOT / "models",
+        config_path=PROJECT_ROOT / "configs" / "models.yaml",
+    )
+    if quant == "auto":
+        chosen = manager.select_quantization(DEMO_MODEL)
+        path = Path(chosen["path"]) if chosen else None
+    else:
+        path = manager.get_model_path(DEMO_MODEL, quantization=quant)
+
+    if path is None:
+        path = (
+            PROJECT_ROOT
+            / "models"
+            / DEMO_MODEL
+            / "gguf"
+            / "q4_k_m"
+            / "Qwen2.5-14B-Instruct-Q4_K_M.gguf"
+        )
+    return str(path)
+
+
 def main():
-    """Run foraging demo with LLM starter agent."""
+    """Run foraging demo with a starter agent."""
+    parser = argparse.ArgumentParser(description="Run the foraging demo")
+    parser.add_argument(
+        "--starter",
+        choices=["llm", "beginner"],
+        default="llm",
+        help="Starter agent to run (default: llm)",
+    )
+    parser.add_argument(
+        "--quant",
+        default="auto",
+        help="GGUF quantization of the LLM (e.g. q4_k_m, q8_0). 'auto' picks the "
+        "largest downloaded one that fits in free GPU memory (default: auto)",
+    )
+    args = parser.parse_args()
+
+    if args.starter == "beginner":
+        # Rule-based agent: no model to load
+        agent = load_starter("beginner").Agent()
+        logger.info("Starting IPC server...")
+        AgentArena(host="127.0.0.1", port=5000, enable_debug=True).run(agent.decide)
+        return 0
+
+    starter = load_starter("llm")
+
     logger.info("=" * 60)
     logger.info("Foraging Demo - LLM Agent (NEW SDK Pattern)")
     logger.info("=" * 60)
@@ -51,15 +134,9 @@ def main():
     try:
         # Create LLM agent
         logger.info("Creating LLM agent...")
-        model_path = str(
-            Path(__file__).parent.parent
-            / "models"
-            / "qwen2.5-14b-instruct"
-            / "gguf"
-            / "q4_k_m"
-            / "Qwen2.5-14B-Instruct-Q4_K_M.gguf"
-        )
-        agent = Agent(model_path=model_path)
+        model_path = find_model(args.quant)
+        logger.info(f"  Model: {model_path}")
+        agent = starter.Agent(model_path=model_path)
         logger.info("  ✓ LLM Agent created")
 
         # Create arena connection
@@ -90,6 +167,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
-
     sys.exit(main())
@@ -36,6 +36,19 @@ def _resolve_callback(
     )
 
 
+def _resolve_batch_callback(
+    agent: Callable[[Observation], Decision] | Any,
+) -> Callable[[list[Observation]], list[Decision]] | None:
+    """Return *agent*'s ``decide_batch`` method, if it has one.
+
+    Agents that can decide a whole tick at once (e.g. one batched model
+    forward pass) implement ``decide_batch(list[Observation]) -> list[Decision]``;
+    ``/tick`` then calls it once per tick instead of ``decide`` per agent.
+    """
+    decide_batch = getattr(agent, "decide_batch", None)
+    return decide_batch if callable(decide_batch) else None
+
+
 class AgentArena:
     """
     Connection manager for Agent Arena game.
@@ -75,6 +88,9 @@ class AgentArena:
         host: str = "127.0.0.1",
         port: int = 5000,
         enable_debug: bool = False,
+        access_log: bool = False,
+        max_workers: int = 1,
+        debug_keep_raw: bool = False,
     ):
         """
         Initialize AgentArena connection.
@@ -84,15 +100,25 @@ class AgentArena:
             port: IPC server port (default: 5000)
             enable_debug: Enable /debug/* endpoints for observation tracking,
                 trace inspection, and web-based trace viewer at /debug
+            access_log: Log every HTTP request (one per agent per tick) via uvicorn
+            max_workers: Number of agents decided at once per tick. Raise it for
+                thread-safe agents backed by a batching LLM server.
+            debug_keep_raw: With enable_debug, include each raw observation in
+                /debug/observations (uses more memory)
         """
         self.host = host
         self.port = port
         self.enable_debug = enable_debug
+        self.debug_keep_raw = debug_keep_raw
+        self.access_log = access_log
+        self.max_workers = max_workers
         self.server: MinimalIPCServer | None = None
 
         logger.info(
-            f"Initialized AgentArena for {host}:{port}"
-            f"{' (debug enabled)' if enable_debug else ''}"
+            "Initialized AgentArena for %s:%s%s",
+            host,
+            port,
+            " (debug enabled)" if enable_debug else "",
         )
 
     def run(self, agent: Callable[[Observation], Decision] | Any) -> None:
@@ -100,12 +126,16 @@ class AgentArena:
         Run the agent server (blocking).
 
         This starts the IPC server and calls your decide function each tick.
-        Blocks until the server is stopped (Ctrl+C).
+        Blocks until the server is stopped (Ctrl+C). The server runs on
+        uvloop when it is installed (it comes with ``uvicorn[standard]`` on
+        Linux and macOS), which cuts per-request event-loop overhead.
 
         Args:
             agent: A callable ``(Observation) -> Decision``, or an object
                 with a ``decide(Observation) -> Decision`` method (e.g. a
-                :class:`~agent_arena_sdk.adapters.FrameworkAdapter`).
+                :class:`~agent_arena_sdk.adapters.FrameworkAdapter`). If the object
+                also has ``decide_batch(list[Observation]) -> list[Decision]``,
+                multi-agent ticks are decided with one call to it.
 
         Example:
             def decide(obs: Observation) -> Decision:
@@ -124,6 +154,10 @@ class AgentArena:
             host=self.host,
             port=self.port,
             enable_debug=self.enable_debug,
+            access_log=self.access_log,
+            max_workers=self.max_workers,
+            decide_batch_callback=_resolve_batch_callback(agent),
+            debug_keep_raw=self.debug_keep_raw,
         )
 
         try:
@@ -137,11 +171,15 @@ class AgentArena:
         """
         Run the agent server (async).
 
-        This is an async version of run() that can be awaited.
+        This is an async version of run() that can be awaited. It runs on the
+        caller's event loop; start that loop with ``uvloop.run(main())``
+        instead of ``asyncio.run(main())`` to get the same fast loop as run().
 
         Args:
             agent: A callable ``(Observation) -> Decision``, or an object
-                with a ``decide(Observation) -> Decision`` method.
+                with a ``decide(Observation) -> Decision`` method. If the object
+                also has ``decide_batch(list[Observation]) -> list[Decision]``,
+                multi-agent ticks are decided with one call to it.
 
         Example:
             async def main():
@@ -163,6 +201,10 @@ class AgentArena:
             host=self.host,
             port=self.port,
             enable_debug=self.enable_debug,
+            access_log=self.access_log,
+            max_workers=self.max_workers,
+            decide_batch_callback=_resolve_batch_callback(agent),
+            debug_keep_raw=self.debug_keep_raw,
         )
 
         await self.server.run_async()
@@ -109,8 +109,9 @@ class SpatialMemory:
             self._init_semantic_memory()
 
         logger.info(
-            f"Initialized SpatialMemory (semantic={enable_semantic}, "
-            f"stale_threshold={stale_threshold})"
+            "Initialized SpatialMemory (semantic=%s, stale_threshold=%s)",
+            enable_semantic,
+            stale_threshold,
         )
 
     def _init_semantic_memory(self):
@@ -246,8 +247,9 @@ class SpatialMemory:
             self._store_or_update(obj)
 
         logger.debug(
-            f"Updated spatial memory from tick {observation.tick}: "
-            f"{len(self._objects)} total objects"
+            "Updated spatial memory from tick %s: %d total objects",
+            observation.tick,
+            len(self._objects),
         )
 
     def _store_or_update(self, obj: WorldObject) -> None:
@@ -290,7 +292,7 @@ class SpatialMemory:
         obj = self._objects.get(name)
         if obj:
             obj.status = "collected"
-            logger.debug(f"Marked {name} as collected")
+            logger.debug("Marked %s as collected", name)
             return True
         return False
 
@@ -307,7 +309,7 @@ class SpatialMemory:
         obj = self._objects.get(name)
         if obj:
             obj.status = "destroyed"
-            logger.debug(f"Marked {name} as destroyed")
+            logger.debug("Marked %s as destroyed", name)
             return True
         return False
 
@@ -549,8 +551,10 @@ class SpatialMemory:
             )
 
         logger.debug(
-            f"Recorded experience: {event.event_type} at tick {event.tick} "
-            f"({len(self._experiences)} total)"
+            "Recorded experience: %s at tick %s (%d total)",
+            event.event_type,
+            event.tick,
+            len(self._experiences),
         )
 
     def get_recent_experiences(self, limit: int = 10) -> list[ExperienceEvent]:
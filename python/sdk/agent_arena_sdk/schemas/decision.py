@@ -5,7 +5,7 @@ Decision schema - what the agent returns to the game.
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """
     What the agent returns to the game each tick.
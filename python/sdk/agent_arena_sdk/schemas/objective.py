@@ -5,7 +5,7 @@ Objective schemas for scenario goals and success metrics.
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricDefinition:
     """
     Definition of a success metric for an objective.
@@ -33,16 +33,21 @@ class MetricDefinition:
         )
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "target": self.target,
-            "weight": self.weight,
-            "lower_is_better": self.lower_is_better,
-            "required": self.required,
-        }
+        """Convert to dictionary for serialization.
+
+        Fields left at their defaults are omitted; from_dict restores them.
+        """
+        data: dict = {"target": self.target}
+        if self.weight != 1.0:
+            data["weight"] = self.weight
+        if self.lower_is_better:
+            data["lower_is_better"] = True
+        if self.required:
+            data["required"] = True
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Objective:
     """
     Scenario-defined goals for the agent.
@@ -95,13 +100,17 @@ class Objective:
         """
         Convert to dictionary for serialization.
 
+        A zero (unlimited) time_limit is omitted; from_dict restores it.
+
         Returns:
             Dictionary representation
         """
-        return {
+        data: dict = {
             "description": self.description,
             "success_metrics": {
                 name: metric.to_dict() for name, metric in self.success_metrics.items()
             },
-            "time_limit": self.time_limit,
         }
+        if self.time_limit:
+            data["time_limit"] = self.time_limit
+        return data
@@ -3,13 +3,19 @@ Observation schema - what the agent receives from the game each tick.
 """
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from sys import intern
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .objective import Objective
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Intern *value* if it is a str; anything else (None, numbers) passes through."""
+    return intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class EntityInfo:
     """Information about a visible entity."""
 
@@ -20,7 +26,7 @@ class EntityInfo:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceInfo:
     """Information about a nearby resource."""
 
@@ -30,7 +36,7 @@ class ResourceInfo:
     distance: float
 
 
-@dataclass
+@dataclass(slots=True)
 class HazardInfo:
     """Information about a nearby hazard."""
 
@@ -41,7 +47,7 @@ class HazardInfo:
     damage: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class StationInfo:
     """Information about a nearby crafting station."""
 
@@ -51,7 +57,7 @@ class StationInfo:
     distance: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result of a tool execution from the previous tick.
 
@@ -94,7 +100,7 @@ class ToolResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemInfo:
     """Information about an inventory item."""
 
@@ -103,7 +109,7 @@ class ItemInfo:
     quantity: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ExploreTarget:
     """A potential exploration target."""
 
@@ -112,7 +118,7 @@ class ExploreTarget:
     position: tuple[float, float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationInfo:
     """
     Information about world exploration status.
@@ -130,15 +136,10 @@ class ExplorationInfo:
     @classmethod
     def from_dict(cls, data: dict) -> "ExplorationInfo":
         """Create from dictionary."""
-        targets = []
-        for t in data.get("explore_targets", []):
-            targets.append(
-                ExploreTarget(
-                    direction=t["direction"],
-                    distance=t["distance"],
-                    position=tuple(t["position"]),
-                )
-            )
+        targets = [
+            ExploreTarget(_intern(t["direction"]), t["distance"], tuple(t["position"]))
+            for t in data.get("explore_targets", ())
+        ]
         return cls(
             exploration_percentage=data.get("exploration_percentage", 0.0),
             total_cells=data.get("total_cells", 0),
@@ -165,7 +166,7 @@ class ExplorationInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """
     What the agent receives from the game each tick.
@@ -232,126 +233,74 @@ class Observation:
         """
         from .objective import Objective
 
-        # Parse position (required)
-        position = (
-            tuple(data["position"]) if isinstance(data["position"], list) else data["position"]
-        )
-
-        # Parse optional rotation
-        rotation = None
-        if "rotation" in data and data["rotation"] is not None:
-            rotation = (
-                tuple(data["rotation"]) if isinstance(data["rotation"], list) else data["rotation"]
-            )
-
-        # Parse optional velocity
-        velocity = None
-        if "velocity" in data and data["velocity"] is not None:
-            velocity = (
-                tuple(data["velocity"]) if isinstance(data["velocity"], list) else data["velocity"]
-            )
-
-        # Parse visible entities
-        visible_entities = []
-        for entity_data in data.get("visible_entities", []):
-            entity_pos = (
-                tuple(entity_data["position"])
-                if isinstance(entity_data["position"], list)
-                else entity_data["position"]
-            )
-            visible_entities.append(
-                EntityInfo(
-                    id=entity_data["id"],
-                    type=entity_data["type"],
-                    position=entity_pos,
-                    distance=entity_data["distance"],
-                    metadata=entity_data.get("metadata", {}),
-                )
-            )
-
-        # Parse nearby resources
-        nearby_resources = []
-        for resource_data in data.get("nearby_resources", []):
-            resource_pos = (
-                tuple(resource_data["position"])
-                if isinstance(resource_data["position"], list)
-                else resource_data["position"]
-            )
-            nearby_resources.append(
-                ResourceInfo(
-                    name=resource_data["name"],
-                    type=resource_data["type"],
-                    position=resource_pos,
-                    distance=resource_data["distance"],
-                )
-            )
-
-        # Parse nearby hazards
-        nearby_hazards = []
-        for hazard_data in data.get("nearby_hazards", []):
-            hazard_pos = (
-                tuple(hazard_data["position"])
-                if isinstance(hazard_data["position"], list)
-                else hazard_data["position"]
-            )
-            nearby_hazards.append(
-                HazardInfo(
-                    name=hazard_data["name"],
-                    type=hazard_data["type"],
-                    position=hazard_pos,
-                    distance=hazard_data["distance"],
-                    damage=hazard_data.get("damage", 0.0),
-                )
-            )
-
-        # Parse nearby stations
-        nearby_stations = []
-        for station_data in data.get("nearby_stations", []):
-            station_pos = (
-                tuple(station_data["position"])
-                if isinstance(station_data["position"], list)
-                else station_data["position"]
+        get = data.get
+
+        # Parse position (required) and optional rotation/velocity. Godot sends
+        # lists; tuple() on an existing tuple returns it unchanged, so no branch.
+        position = tuple(data["position"])
+        rotation = get("rotation")
+        if rotation is not None:
+            rotation = tuple(rotation)
+        velocity = get("velocity")
+        if velocity is not None:
+            velocity = tuple(velocity)
+
+        # Parse nearby entities. These run for every entity of every agent on
+        # every tick, so construct positionally rather than by keyword. The
+        # low-cardinality ids and types are interned so entries share them.
+        visible_entities = [
+            EntityInfo(
+                _intern(e["id"]),
+                _intern(e["type"]),
+                tuple(e["position"]),
+                e["distance"],
+                e.get("metadata", {}),
             )
-            nearby_stations.append(
-                StationInfo(
-                    name=station_data["name"],
-                    type=station_data["type"],
-                    position=station_pos,
-                    distance=station_data["distance"],
-                )
+            for e in get("visible_entities", ())
+        ]
+        nearby_resources = [
+            ResourceInfo(r["name"], _intern(r["type"]), tuple(r["position"]), r["distance"])
+            for r in get("nearby_resources", ())
+        ]
+        nearby_hazards = [
+            HazardInfo(
+                h["name"],
+                _intern(h["type"]),
+                tuple(h["position"]),
+                h["distance"],
+                h.get("damage", 0.0),
             )
+            for h in get("nearby_hazards", ())
+        ]
+        nearby_stations = [
+            StationInfo(s["name"], _intern(s["type"]), tuple(s["position"]), s["distance"])
+            for s in get("nearby_stations", ())
+        ]
 
         # Parse inventory (list[ItemInfo] format; dict format goes to custom)
-        inventory = []
-        raw_inventory = data.get("inventory", [])
+        raw_inventory = get("inventory", ())
+        inventory: list[ItemInfo] = []
         if isinstance(raw_inventory, list):
-            for item_data in raw_inventory:
-                if isinstance(item_data, dict) and "id" in item_data:
-                    inventory.append(
-                        ItemInfo(
-                            id=item_data["id"],
-                            name=item_data["name"],
-                            quantity=item_data.get("quantity", 1),
-                        )
-                    )
+            inventory = [
+                ItemInfo(item["id"], item["name"], item.get("quantity", 1))
+                for item in raw_inventory
+                if isinstance(item, dict) and "id" in item
+            ]
 
         # Parse exploration data
-        exploration = None
-        if "exploration" in data and data["exploration"]:
-            exploration = ExplorationInfo.from_dict(data["exploration"])
+        exploration = get("exploration")
+        exploration = ExplorationInfo.from_dict(exploration) if exploration else None
 
         # Parse objective (NEW)
-        objective = None
-        if "objective" in data and data["objective"]:
-            objective = Objective.from_dict(data["objective"])
+        objective = get("objective")
+        objective = Objective.from_dict(objective) if objective else None
 
         # Parse tool result from last action (Issue #71)
-        last_tool_result = None
-        if "tool_result" in data and data["tool_result"]:
-            last_tool_result = ToolResult.from_dict(data["tool_result"])
+        last_tool_result = get("tool_result")
+        last_tool_result = ToolResult.from_dict(last_tool_result) if last_tool_result else None
 
         return cls(
-            agent_id=data["agent_id"],
+            agent_id=_intern(data["agent_id"]),
             tick=data["tick"],
             position=position,
             rotation=rotation,
@@ -361,14 +310,14 @@ class Observation:
             nearby_hazards=nearby_hazards,
             nearby_stations=nearby_stations,
             inventory=inventory,
-            health=data.get("health", 100.0),
-            energy=data.get("energy", 100.0),
-            perception_radius=data.get("perception_radius", 50.0),
+            health=get("health", 100.0),
+            energy=get("energy", 100.0),
+            perception_radius=get("perception_radius", 50.0),
             exploration=exploration,
-            scenario_name=data.get("scenario_name", ""),
+            scenario_name=_intern(get("scenario_name", "")),
             objective=objective,
-            current_progress=data.get("current_progress", {}),
-            custom=data.get("custom", {}),
+            current_progress=get("current_progress", {}),
+            custom=get("custom", {}),
             last_tool_result=last_tool_result,
         )
 
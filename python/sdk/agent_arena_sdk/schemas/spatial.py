@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from .observation import EntityInfo, HazardInfo, ResourceInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldObject:
     """A remembered object in the world map.
 
@@ -102,7 +102,7 @@ class WorldObject:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperienceEvent:
     """A significant event the agent experienced.
 
@@ -144,7 +144,7 @@ class ExperienceEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SpatialQueryResult:
     """Result from a spatial memory query."""
 
@@ -5,7 +5,7 @@ Tool schemas for defining available actions.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolSchema:
     """
     Schema for an available tool/action.
@@ -8,19 +8,52 @@ as the old standalone observe_inspector tool, but running alongside the agent.
 from __future__ import annotations
 
 import threading
+import time
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any
 
 
-@dataclass
+def _sorted_names(items: list[Any]) -> list[str]:
+    """Return the unique names of observed items, sorted."""
+    names = sorted(item.get("name", str(item)) for item in items)
+    # Drop adjacent duplicates in place; names are unique in practice.
+    for i in range(len(names) - 1, 0, -1):
+        if names[i] == names[i - 1]:
+            del names[i]
+    return names
+
+
+def _diff_sorted(old: list[str], new: list[str]) -> tuple[list[str], list[str]]:
+    """Merge-walk two sorted name lists and return ``(gained, lost)``."""
+    gained: list[str] = []
+    lost: list[str] = []
+    i = j = 0
+    while i < len(old) and j < len(new):
+        if old[i] == new[j]:
+            i += 1
+            j += 1
+        elif old[i] < new[j]:
+            lost.append(old[i])
+            i += 1
+        else:
+            gained.append(new[j])
+            j += 1
+    lost.extend(old[i:])
+    gained.extend(new[j:])
+    return gained, lost
+
+
+@dataclass(slots=True)
 class ObservationEntry:
     """A single tracked observation with visibility change analysis."""
 
     tick: int
     agent_id: str
-    timestamp: str
+    time_ns: int  # Wall-clock time.time_ns() when tracked
     position: list[float]
     visible_resources: list[str]
     visible_hazards: list[str]
@@ -28,23 +61,35 @@ class ObservationEntry:
     lost_resources: list[str]
     gained_hazards: list[str]
     lost_hazards: list[str]
-    raw_observation: dict[str, Any] = field(repr=False)
+    raw_observation: dict[str, Any] | None = field(default=None, repr=False)
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
-        return {
-            "tick": self.tick,
-            "agent_id": self.agent_id,
-            "timestamp": self.timestamp,
-            "position": self.position,
-            "visible_resources": self.visible_resources,
-            "visible_hazards": self.visible_hazards,
-            "gained_resources": self.gained_resources,
-            "lost_resources": self.lost_resources,
-            "gained_hazards": self.gained_hazards,
-            "lost_hazards": self.lost_hazards,
-            "raw_observation": self.raw_observation,
-        }
+        """Convert to JSON-serializable dictionary.
+
+        Entries don't change once tracked, so the result is built once and
+        reused by every later poll of the debug endpoints.
+        """
+        if self._dict is None:
+            self._dict = {
+                "tick": self.tick,
+                "agent_id": self.agent_id,
+                "timestamp": self.timestamp,
+                "position": self.position,
+                "visible_resources": self.visible_resources,
+                "visible_hazards": self.visible_hazards,
+                "gained_resources": self.gained_resources,
+                "lost_resources": self.lost_resources,
+                "gained_hazards": self.gained_hazards,
+                "lost_hazards": self.lost_hazards,
+                "raw_observation": self.raw_observation,
+            }
+        return self._dict
+
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 UTC timestamp, formatted only when serialized."""
+        return datetime.fromtimestamp(self.time_ns / 1e9, tz=timezone.utc).isoformat()
 
     @property
     def has_changes(self) -> bool:
@@ -58,14 +103,29 @@ class ObservationTracker:
     """Tracks observations and detects visibility changes per agent.
 
     Uses a fixed-size ring buffer (deque) for in-memory storage so it
-    never grows unbounded.  Thread-safe for concurrent access.
+    never grows unbounded.  Thread-safe for concurrent access: per-agent
+    state is split across lock stripes so agents decided in parallel don't
+    contend, and a separate lock guards the shared ring buffer.
     """
 
-    def __init__(self, max_entries: int = 1000) -> None:
+    LOCK_STRIPES = 16  # Power of two, so a stripe is picked with a mask
+
+    def __init__(self, max_entries: int = 1000, keep_raw: bool = False) -> None:
+        """
+        Args:
+            max_entries: Size of the ring buffer of tracked observations.
+            keep_raw: Also keep each full observation dict on its entry. Off by
+                default; a full buffer of raw observations can pin megabytes.
+        """
+        self.keep_raw = keep_raw
         self._observations: deque[ObservationEntry] = deque(maxlen=max_entries)
-        # Per-agent last-seen sets: agent_id -> (resources, hazards)
-        self._last_visible: dict[str, tuple[set[str], set[str]]] = {}
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # Guards _observations
+        # Per-agent last-seen names, kept sorted: agent_id -> (resources, hazards),
+        # sharded by hash(agent_id) with one lock per shard.
+        self._last_visible: list[dict[str, tuple[list[str], list[str]]]] = [
+            {} for _ in range(self.LOCK_STRIPES)
+        ]
+        self._stripe_locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
 
     def track_observation(self, observation: dict[str, Any]) -> ObservationEntry:
         """Record an observation and compute visibility changes.
@@ -76,6 +136,29 @@ class ObservationTracker:
         Returns:
             The created ObservationEntry with change analysis.
         """
+        entry = self._make_entry(observation)
+        with self._lock:
+            self._observations.append(entry)
+
+        return entry
+
+    def track_observations(self, observations: Iterable[dict[str, Any]]) -> list[ObservationEntry]:
+        """Record a batch of observations (e.g. one tick) with a single buffer append.
+
+        Args:
+            observations: Raw observation dicts from Godot, in order.
+
+        Returns:
+            The created ObservationEntry objects, in the same order.
+        """
+        entries = [self._make_entry(observation) for observation in observations]
+        with self._lock:
+            self._observations.extend(entries)
+
+        return entries
+
+    def _make_entry(self, observation: dict[str, Any]) -> ObservationEntry:
+        """Build the entry for one observation and update the agent's visibility."""
         agent_id = observation.get("agent_id", "unknown")
         tick = observation.get("tick", 0)
         position = observation.get("position", [0, 0, 0])
@@ -83,35 +166,32 @@ class ObservationTracker:
         nearby_resources = observation.get("nearby_resources", [])
         nearby_hazards = observation.get("nearby_hazards", [])
 
-        current_resources = {r.get("name", str(r)) for r in nearby_resources}
-        current_hazards = {h.get("name", str(h)) for h in nearby_hazards}
-
-        with self._lock:
-            last_resources, last_hazards = self._last_visible.get(agent_id, (set(), set()))
-
-            gained_resources = current_resources - last_resources
-            lost_resources = last_resources - current_resources
-            gained_hazards = current_hazards - last_hazards
-            lost_hazards = last_hazards - current_hazards
-
-            self._last_visible[agent_id] = (current_resources, current_hazards)
-
-            entry = ObservationEntry(
-                tick=tick,
-                agent_id=agent_id,
-                timestamp=datetime.now(tz=timezone.utc).isoformat(),
-                position=position,
-                visible_resources=sorted(current_resources),
-                visible_hazards=sorted(current_hazards),
-                gained_resources=sorted(gained_resources),
-                lost_resources=sorted(lost_resources),
-                gained_hazards=sorted(gained_hazards),
-                lost_hazards=sorted(lost_hazards),
-                raw_observation=observation,
-            )
-            self._observations.append(entry)
-
-        return entry
+        current_resources = _sorted_names(nearby_resources)
+        current_hazards = _sorted_names(nearby_hazards)
+
+        stripe = hash(agent_id) & (self.LOCK_STRIPES - 1)
+        last_visible = self._last_visible[stripe]
+        with self._stripe_locks[stripe]:
+            last_resources, last_hazards = last_visible.get(agent_id, ([], []))
+            last_visible[agent_id] = (current_resources, current_hazards)
+
+        # The name lists are never mutated once stored, so diff outside the lock
+        gained_resources, lost_resources = _diff_sorted(last_resources, current_resources)
+        gained_hazards, lost_hazards = _diff_sorted(last_hazards, current_hazards)
+
+        return ObservationEntry(
+            tick=tick,
+            agent_id=agent_id,
+            time_ns=time.time_ns(),
+            position=position,
+            visible_resources=current_resources,
+            visible_hazards=current_hazards,
+            gained_resources=gained_resources,
+            lost_resources=lost_resources,
+            gained_hazards=gained_hazards,
+            lost_hazards=lost_hazards,
+            raw_observation=observation if self.keep_raw else None,
+        )
 
     def get_recent(
         self,
@@ -119,13 +199,7 @@ class ObservationTracker:
         agent_id: str | None = None,
     ) -> list[dict[str, Any]]:
         """Return the most recent observations."""
-        with self._lock:
-            items = list(self._observations)
-
-        if agent_id:
-            items = [o for o in items if o.agent_id == agent_id]
-
-        return [o.to_dict() for o in items[-limit:]]
+        return [o.to_dict() for o in self._newest(limit, agent_id, changes_only=False)]
 
     def get_changes(
         self,
@@ -133,17 +207,48 @@ class ObservationTracker:
         agent_id: str | None = None,
     ) -> list[dict[str, Any]]:
         """Return only observations where visibility changed."""
-        with self._lock:
-            items = list(self._observations)
+        return [o.to_dict() for o in self._newest(limit, agent_id, changes_only=True)]
 
-        if agent_id:
-            items = [o for o in items if o.agent_id == agent_id]
+    def _newest(
+        self, limit: int, agent_id: str | None, changes_only: bool
+    ) -> list[ObservationEntry]:
+        """Select up to *limit* matching entries, oldest first.
 
-        changed = [o for o in items if o.has_changes]
-        return [o.to_dict() for o in changed[-limit:]]
+        Walks the ring buffer from the newest end and stops once *limit*
+        entries match, so only the returned entries are ever converted.
+        """
+        if not agent_id and not changes_only:
+            # Unfiltered: copy just the tail window, in C, under the lock.
+            with self._lock:
+                selected = list(islice(reversed(self._observations), limit))
+            selected.reverse()
+            return selected
+
+        selected = []
+        with self._lock:
+            for entry in reversed(self._observations):
+                if len(selected) >= limit:
+                    break
+                if agent_id and entry.agent_id != agent_id:
+                    continue
+                if changes_only and not entry.has_changes:
+                    continue
+                selected.append(entry)
+        selected.reverse()
+        return selected
+
+    def agent_ids(self) -> set[str]:
+        """Return the ids of every agent with tracked visibility."""
+        agents: set[str] = set()
+        for lock, last_visible in zip(self._stripe_locks, self._last_visible):
+            with lock:
+                agents.update(last_visible)
+        return agents
 
     def clear(self) -> None:
         """Clear all tracked observations."""
         with self._lock:
             self._observations.clear()
-            self._last_visible.clear()
+        for lock, last_visible in zip(self._stripe_locks, self._last_visible):
+            with lock:
+                last_visible.clear()
@@ -10,22 +10,38 @@ standalone), the store operates in memory-only mode.
 
 from __future__ import annotations
 
+import itertools
 import logging
+import secrets
 import threading
 import time
-import uuid
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Trace ids: a random per-process prefix plus a counter, so minting one
+# needs no syscall (uuid4 reads the OS entropy source on every call). The
+# prefix is 64 random bits so that processes writing to the same trace files
+# do not draw the same prefix and repeat each other's ids.
+_TRACE_ID_PREFIX = secrets.token_hex(8)
+_trace_id_counter = itertools.count()
+
+
+def _new_trace_id() -> str:
+    return f"{_TRACE_ID_PREFIX}{next(_trace_id_counter):04x}"
+
+
+# Payload types _serialize passes through unchanged (matched by exact type)
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 # ---------------------------------------------------------------------------
 # Lightweight trace dataclasses (SDK-local, no agent_runtime dependency)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugTraceStep:
     """A single step inside a reasoning trace."""
 
@@ -44,15 +60,40 @@ class DebugTraceStep:
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> DebugTraceStep:
+        timestamp = d.get("timestamp")
         return cls(
             name=d["name"],
             data=d["data"],
-            timestamp=d.get("timestamp", time.time()),
+            timestamp=time.time() if timestamp is None else timestamp,
             elapsed_ms=d.get("elapsed_ms", 0.0),
         )
 
+    @classmethod
+    def _trusted(cls, name: str, data: Any, timestamp: float, elapsed_ms: float) -> DebugTraceStep:
+        """Build a step from fields produced by our own code, skipping ``__init__``.
+
+        Used when bulk-loading traces; ``from_dict`` remains the entry point
+        for anything else.
+        """
+        step = object.__new__(cls)
+        step.name = name
+        step.data = data
+        step.timestamp = timestamp
+        step.elapsed_ms = elapsed_ms
+        return step
+
     @staticmethod
     def _serialize(data: Any) -> Any:
+        # Exact-type checks first: one hash lookup covers the common payloads,
+        # the isinstance chain below only runs for subclasses and objects.
+        data_type = type(data)
+        if data_type in _SCALAR_TYPES:
+            return data
+        if data_type is dict:
+            return {str(k): DebugTraceStep._serialize(v) for k, v in data.items()}
+        if data_type is list or data_type is tuple:
+            return [DebugTraceStep._serialize(i) for i in data]
+
         if data is None or isinstance(data, (str, int, float, bool)):
             return data
         if isinstance(data, (list, tuple)):
@@ -64,7 +105,7 @@ class DebugTraceStep:
         return str(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugTrace:
     """A complete reasoning trace for one agent decision tick."""
 
@@ -72,16 +113,22 @@ class DebugTrace:
     tick: int
     episode_id: str = ""
     steps: list[DebugTraceStep] = field(default_factory=list)
-    trace_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    trace_id: str = field(default_factory=_new_trace_id)
     start_time: float = field(default_factory=time.time)
+    # perf_counter() reading that corresponds to start_time; steps are timed
+    # against it so the wall clock is only read once per trace.
+    _start_perf: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._start_perf = time.perf_counter() - (time.time() - self.start_time)
 
     def add_step(self, name: str, data: Any) -> DebugTraceStep:
-        now = time.time()
+        elapsed = time.perf_counter() - self._start_perf
         step = DebugTraceStep(
             name=name,
             data=data,
-            timestamp=now,
-            elapsed_ms=(now - self.start_time) * 1000,
+            timestamp=self.start_time + elapsed,
+            elapsed_ms=elapsed * 1000,
         )
         self.steps.append(step)
         return step
@@ -98,14 +145,19 @@ class DebugTrace:
 
     @classmethod
     def from_dict(cls, d: dict[str, Any]) -> DebugTrace:
+        now = time.time()
         trace = cls(
             agent_id=d["agent_id"],
             tick=d["tick"],
             episode_id=d.get("episode_id", ""),
-            trace_id=d.get("trace_id", uuid.uuid4().hex[:8]),
-            start_time=d.get("start_time", time.time()),
+            trace_id=d.get("trace_id") or _new_trace_id(),
+            start_time=d.get("start_time", now),
         )
-        trace.steps = [DebugTraceStep.from_dict(s) for s in d.get("steps", [])]
+        trusted = DebugTraceStep._trusted
+        trace.steps = [
+            trusted(s["name"], s["data"], s.get("timestamp", now), s.get("elapsed_ms", 0.0))
+            for s in d.get("steps", ())
+        ]
         return trace
 
 
@@ -140,16 +192,10 @@ def _runtime_trace_to_debug(rt: Any) -> DebugTrace:
         agent_id=rt.agent_id,
         tick=rt.tick,
         episode_id=getattr(rt, "episode_id", ""),
-        trace_id=getattr(rt, "trace_id", uuid.uuid4().hex[:8]),
+        trace_id=getattr(rt, "trace_id", None) or _new_trace_id(),
         start_time=getattr(rt, "start_time", time.time()),
         steps=[
-            DebugTraceStep(
-                name=s.name,
-                data=s.data,
-                timestamp=s.timestamp,
-                elapsed_ms=s.elapsed_ms,
-            )
-            for s in rt.steps
+            DebugTraceStep._trusted(s.name, s.data, s.timestamp, s.elapsed_ms) for s in rt.steps
         ],
     )
 
@@ -169,6 +215,10 @@ class DebugStore:
 
     def __init__(self, max_memory_traces: int = 1000) -> None:
         self._buffer: deque[DebugTrace] = deque(maxlen=max_memory_traces)
+        # Per-agent view of the ring buffer, so agent-filtered queries don't
+        # scan every agent's traces. Holds references only and drops a trace
+        # (and an agent with none left) when the ring buffer evicts it.
+        self._by_agent: dict[str, deque[DebugTrace]] = {}
         self._lock = threading.Lock()
 
         # Optional persistent store
@@ -196,30 +246,53 @@ class DebugStore:
     def record_trace(self, trace: DebugTrace) -> None:
         """Add a trace to the in-memory buffer and persist if available."""
         with self._lock:
-            self._buffer.append(trace)
+            self._append(trace)
 
-        if self._trace_store is not None and _ReasoningTrace is not None:
-            try:
-                rt = _ReasoningTrace(
-                    agent_id=trace.agent_id,
-                    tick=trace.tick,
-                    episode_id=trace.episode_id,
-                    trace_id=trace.trace_id,
-                    start_time=trace.start_time,
-                )
-                for step in trace.steps:
-                    rt_step = rt.add_step(step.name, step.data)
-                    rt_step.timestamp = step.timestamp
-                    rt_step.elapsed_ms = step.elapsed_ms
-                self._trace_store._write_trace(rt)
-            except Exception as exc:
-                logger.warning("DebugStore: failed to persist trace: %s", exc)
+        if self._trace_store is not None:
+            self._persist(trace)
+
+    def _persist(self, trace: DebugTrace) -> None:
+        """Write one trace through the agent_runtime TraceStore."""
+        if _ReasoningTrace is None or self._trace_store is None:
+            return
+        try:
+            rt = _ReasoningTrace(
+                agent_id=trace.agent_id,
+                tick=trace.tick,
+                episode_id=trace.episode_id,
+                trace_id=trace.trace_id,
+                start_time=trace.start_time,
+            )
+            for step in trace.steps:
+                rt_step = rt.add_step(step.name, step.data)
+                rt_step.timestamp = step.timestamp
+                rt_step.elapsed_ms = step.elapsed_ms
+            self._trace_store._write_trace(rt)
+        except Exception as exc:
+            logger.warning("DebugStore: failed to persist trace: %s", exc)
+
+    def _append(self, trace: DebugTrace) -> None:
+        """Add a trace to the ring buffer and its agent's index (lock held)."""
+        buffer = self._buffer
+        if buffer.maxlen is not None and len(buffer) == buffer.maxlen:
+            # The oldest trace is about to be evicted; it is also the oldest
+            # entry of its agent's index.
+            evicted = buffer[0]
+            evicted_traces = self._by_agent[evicted.agent_id]
+            evicted_traces.popleft()
+            if not evicted_traces:
+                del self._by_agent[evicted.agent_id]
+        buffer.append(trace)
+        agent_traces = self._by_agent.get(trace.agent_id)
+        if agent_traces is None:
+            agent_traces = self._by_agent[trace.agent_id] = deque()
+        agent_traces.append(trace)
 
     def record_runtime_trace(self, rt: Any) -> None:
         """Record an agent_runtime ReasoningTrace (from existing instrumentation)."""
         debug_trace = _runtime_trace_to_debug(rt)
         with self._lock:
-            self._buffer.append(debug_trace)
+            self._append(debug_trace)
         # The runtime's own TraceStore already persists it, so skip double-write.
 
     # -- querying -----------------------------------------------------------
@@ -231,19 +304,38 @@ class DebugStore:
         tick_start: int | None = None,
         tick_end: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Return recent traces from the in-memory buffer."""
-        with self._lock:
-            items = list(self._buffer)
+        """Return recent traces from the in-memory buffer, ordered by tick."""
+        traces = self.get_recent_trace_objects(limit, agent_id, tick_start, tick_end)
+        return [t.to_dict() for t in traces]
 
-        if agent_id:
-            items = [t for t in items if t.agent_id == agent_id]
-        if tick_start is not None:
-            items = [t for t in items if t.tick >= tick_start]
-        if tick_end is not None:
-            items = [t for t in items if t.tick <= tick_end]
+    def get_recent_trace_objects(
+        self,
+        limit: int = 50,
+        agent_id: str | None = None,
+        tick_start: int | None = None,
+        tick_end: int | None = None,
+    ) -> list[DebugTrace]:
+        """Return recent traces as the stored DebugTrace objects, ordered by tick.
+
+        Traces are appended as ticks advance, so the buffer (or the agent's
+        own index, when *agent_id* is given) is scanned from the newest end
+        and the scan stops once *limit* traces match. The traces themselves
+        are shared with the buffer and must not be mutated by the caller.
+        """
+        items: list[DebugTrace] = []
+        with self._lock:
+            source = self._by_agent.get(agent_id, ()) if agent_id else self._buffer
+            for t in reversed(source):
+                if len(items) >= limit:
+                    break
+                if tick_start is not None and t.tick < tick_start:
+                    continue
+                if tick_end is not None and t.tick > tick_end:
+                    continue
+                items.append(t)
 
         items.sort(key=lambda t: t.tick)
-        return [t.to_dict() for t in items[-limit:]]
+        return items
 
     def get_episode_traces(self, agent_id: str, episode_id: str) -> list[dict[str, Any]]:
         """Read all traces for an episode from persistent storage."""
@@ -261,7 +353,7 @@ class DebugStore:
         agents: set[str] = set()
 
         with self._lock:
-            agents.update(t.agent_id for t in self._buffer)
+            agents.update(self._by_agent)
 
         if self._trace_store is not None:
             try:
@@ -311,3 +403,4 @@ class DebugStore:
         """Clear in-memory buffer."""
         with self._lock:
             self._buffer.clear()
+            self._by_agent.clear()
@@ -6,17 +6,93 @@ It does NOT include behavior management, tool dispatching, or runtime complexity
 Those features are either handled by Godot (tools) or by learner code (behaviors).
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 
 from ..schemas import Decision, Observation
 
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; JSON is always available
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+async def _read_payload(request: Request) -> dict[str, Any]:
+    """Decode a JSON or msgpack request body into a dict.
+
+    msgpack is used when the request's Content-Type is ``application/msgpack``;
+    anything else is treated as JSON (what Godot sends).
+    """
+    is_msgpack = request.headers.get("content-type", "").startswith(MSGPACK_MEDIA_TYPE)
+    if is_msgpack and msgpack is None:
+        raise HTTPException(status_code=415, detail="msgpack is not installed on the server")
+    try:
+        if is_msgpack:
+            payload = msgpack.unpackb(await request.body())
+        else:
+            payload = await request.json()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid request body: {e}")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Request body must be an object")
+    return payload
+
+
+def _wants_msgpack(request: Request) -> bool:
+    """Whether the client asked for (or sent) msgpack and should get it back."""
+    if msgpack is None:
+        return False
+    accept = request.headers.get("accept", "")
+    content_type = request.headers.get("content-type", "")
+    return MSGPACK_MEDIA_TYPE in accept or content_type.startswith(MSGPACK_MEDIA_TYPE)
+
+
+def _encode_response(request: Request, result: dict[str, Any]) -> Response:
+    """Encode *result* as msgpack when negotiated, otherwise as JSON.
+
+    *result* is already built from plain JSON types, so it is dumped directly
+    rather than going through FastAPI's jsonable_encoder walk on every tick.
+    JSON is encoded with orjson when it is installed.
+    """
+    if _wants_msgpack(request):
+        return Response(content=msgpack.packb(result), media_type=MSGPACK_MEDIA_TYPE)
+    if orjson is not None:
+        content = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+        return Response(content=content, media_type="application/json")
+    return JSONResponse(result)
+
+
+def _traces_response(traces: list[Any]) -> Response:
+    """Encode debug traces as ``{"traces": [...], "count": n}``.
+
+    With orjson the traces are handed over by reference and each one is
+    converted through its ``to_dict()`` during encoding, so no intermediate
+    list of dicts is built.
+    """
+    if orjson is not None:
+        content = orjson.dumps(
+            {"traces": traces, "count": len(traces)},
+            default=lambda t: t.to_dict(),
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS,
+        )
+        return Response(content=content, media_type="application/json")
+    return JSONResponse({"traces": [t.to_dict() for t in traces], "count": len(traces)})
+
 
 class MinimalIPCServer:
     """
@@ -39,6 +115,10 @@ class MinimalIPCServer:
         host: str = "127.0.0.1",
         port: int = 5000,
         enable_debug: bool = False,
+        access_log: bool = False,
+        max_workers: int = 1,
+        decide_batch_callback: Callable[[list[Observation]], list[Decision]] | None = None,
+        debug_keep_raw: bool = False,
     ):
         """
         Initialize the minimal IPC server.
@@ -49,27 +129,54 @@ class MinimalIPCServer:
             port: Port to listen on
             enable_debug: Enable /debug/* endpoints for observation tracking,
                 trace inspection, and web-based trace viewer
+            access_log: Log every HTTP request via uvicorn. Off by default since
+                Godot posts an observation per agent per tick.
+            max_workers: Number of decide calls that may run at once. Decisions
+                always run off the event loop; with more than one worker the
+                agents in a /tick are decided concurrently, which lets a
+                server-backed LLM (e.g. vLLM) batch their requests. Only raise
+                this if your decide callback is thread-safe.
+            decide_batch_callback: Optional function that takes every agent's
+                Observation in a /tick and returns their Decisions in the same
+                order. When set, /tick makes one call per tick instead of one
+                per agent, e.g. for a single batched model forward pass.
+                /observe always uses decide_callback.
+            debug_keep_raw: With enable_debug, keep each raw observation dict
+                so /debug/observations includes ``raw_observation``. Off by
+                default since it holds on to every payload in the buffer.
         """
         self.decide_callback = decide_callback
+        self.decide_batch_callback = decide_batch_callback
         self.host = host
         self.port = port
         self.enable_debug = enable_debug
+        self.debug_keep_raw = debug_keep_raw
+        self.access_log = access_log
+        self.max_workers = max_workers
         self.app: FastAPI | None = None
-        self.metrics = {
-            "total_ticks": 0,
-            "total_observations": 0,
-        }
+        self._executor: ThreadPoolExecutor | None = None
+        # Plain int counters; metrics builds the dict only when read.
+        self.total_ticks = 0
+        self.total_observations = 0
 
         # Debug subsystems (created lazily in create_app when enabled)
         self.observation_tracker: Any = None
         self.debug_store: Any = None
 
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Snapshot of the request counters."""
+        return {
+            "total_ticks": self.total_ticks,
+            "total_observations": self.total_observations,
+        }
+
     def _init_debug(self) -> None:
         """Initialize debug subsystems."""
         from .debug_middleware import ObservationTracker
         from .debug_store import DebugStore
 
-        self.observation_tracker = ObservationTracker()
+        self.observation_tracker = ObservationTracker(keep_raw=self.debug_keep_raw)
         self.debug_store = DebugStore()
         logger.info("Debug mode enabled — /debug/* endpoints available")
 
@@ -78,6 +185,11 @@ class MinimalIPCServer:
         if self.observation_tracker is not None:
             self.observation_tracker.track_observation(observation)
 
+    def _track_observations(self, observations: list[dict[str, Any]]) -> None:
+        """Track a whole tick of observations at once (no-op when debug disabled)."""
+        if self.observation_tracker is not None:
+            self.observation_tracker.track_observations(observations)
+
     def _record_decision_trace(
         self, agent_id: str, obs: "Observation", decision: "Decision"
     ) -> None:
@@ -98,7 +210,9 @@ class MinimalIPCServer:
             trace.add_step(
                 "observation",
                 {
-                    "position": list(obs.position) if obs.position else [],
+                    # from_dict already made this a tuple; share it, to_dict()
+                    # turns it into a list only when the trace is served.
+                    "position": obs.position or (),
                     "health": obs.health,
                     "energy": obs.energy,
                     "nearby_resources": len(obs.nearby_resources) if obs.nearby_resources else 0,
@@ -156,6 +270,132 @@ class MinimalIPCServer:
         except Exception as exc:
             logger.debug("Failed to record trace: %s", exc)
 
+    def _decide_observation(self, observation: dict[str, Any]) -> dict[str, Any]:
+        """Run the decide callback for one /observe request (worker thread)."""
+        agent_id = observation.get("agent_id", "unknown")
+
+        logger.debug("[/observe] Processing observation for agent '%s'", agent_id)
+
+        # Track observation for debug (no-op when disabled)
+        self._track_observation(observation)
+
+        # Parse observation
+        obs = Observation.from_dict(observation)
+
+        # Call user's decide callback
+        decision = self.decide_callback(obs)
+
+        # Record trace for debug (no-op when disabled)
+        self._record_decision_trace(agent_id, obs, decision)
+
+        logger.debug("Agent %s decided: %s", agent_id, decision.tool)
+
+        return {
+            "agent_id": agent_id,
+            "tool": decision.tool,
+            "params": decision.params,
+            "reasoning": decision.reasoning or "Agent decision",
+        }
+
+    def _tick_observation(
+        self, agent_data: dict[str, Any], tick: int
+    ) -> tuple[Any, dict[str, Any]]:
+        """Return ``(agent_id, observation dict)`` for one agent of a /tick."""
+        agent_id = agent_data.get("agent_id")
+        obs_data = agent_data.get("observations", {})
+
+        # Add agent_id and tick to observation data if not present
+        if "agent_id" not in obs_data:
+            obs_data["agent_id"] = agent_id
+        if "tick" not in obs_data:
+            obs_data["tick"] = tick
+        return agent_id, obs_data
+
+    def _decide_tick_agent(self, agent_data: dict[str, Any], tick: int) -> dict[str, Any]:
+        """Run the decide callback for one agent of a /tick request (worker thread).
+
+        Errors fall back to an idle action so one agent cannot fail the tick.
+        """
+        agent_id, obs_data = self._tick_observation(agent_data, tick)
+
+        # Track observation for debug (no-op when disabled)
+        self._track_observation(obs_data)
+
+        try:
+            # Parse observation
+            observation = Observation.from_dict(obs_data)
+
+            # Call user's decide callback
+            decision = self.decide_callback(observation)
+
+            logger.debug("Agent %s decided: %s", agent_id, decision.tool)
+
+        except Exception as e:
+            logger.error("Error processing agent %s: %s", agent_id, e, exc_info=True)
+            # Fallback to idle
+            decision = Decision.idle(reasoning=f"Error: {str(e)}")
+
+        # Convert decision to action format
+        return {
+            "agent_id": agent_id,
+            "action": decision.to_dict(),
+        }
+
+    def _decide_tick_batch(
+        self,
+        decide_batch: Callable[[list[Observation]], list[Decision]],
+        agents_data: list[dict[str, Any]],
+        tick: int,
+    ) -> list[dict[str, Any]]:
+        """Run the batch decide callback for a whole /tick request (worker thread).
+
+        An agent whose observation fails to parse idles on its own; if the
+        batch callback itself fails, every agent in the batch idles.
+        """
+        tick_observations = [self._tick_observation(a, tick) for a in agents_data]
+        agent_ids = [agent_id for agent_id, _ in tick_observations]
+
+        # Track the whole tick for debug in one go (no-op when disabled)
+        self._track_observations([obs_data for _, obs_data in tick_observations])
+
+        decisions: dict[int, Decision] = {}
+        batch_index: list[int] = []
+        batch: list[Observation] = []
+        for i, (agent_id, obs_data) in enumerate(tick_observations):
+            try:
+                batch.append(Observation.from_dict(obs_data))
+                batch_index.append(i)
+            except Exception as e:
+                logger.error("Error parsing observation for agent %s: %s", agent_id, e)
+                decisions[i] = Decision.idle(reasoning=f"Error: {str(e)}")
+
+        if batch:
+            try:
+                results = list(decide_batch(batch))
+                if len(results) != len(batch):
+                    raise ValueError(
+                        f"decide_batch_callback returned {len(results)} decisions "
+                        f"for {len(batch)} observations"
+                    )
+            except Exception as e:
+                logger.error("Error in batch decide for tick %s: %s", tick, e, exc_info=True)
+                results = [Decision.idle(reasoning=f"Error: {str(e)}")] * len(batch)
+            decisions.update(zip(batch_index, results))
+
+        return [
+            {"agent_id": agent_id, "action": decisions[i].to_dict()}
+            for i, agent_id in enumerate(agent_ids)
+        ]
+
+    async def _in_worker(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run *func* on the decision thread pool without blocking the event loop."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="decide"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
     def create_app(self) -> FastAPI:
         """Create and configure the FastAPI application."""
         app = FastAPI(
@@ -182,46 +422,25 @@ class MinimalIPCServer:
             return {"status": "ok"}
 
         @app.post("/observe")
-        async def process_observation(observation: dict[str, Any]) -> dict[str, Any]:
+        async def process_observation(request: Request) -> Any:
             """
             Process a single observation from Godot and return a decision.
 
             This is the endpoint Godot calls each tick for each agent.
+            Accepts JSON or msgpack (``Content-Type: application/msgpack``).
             """
+            observation = await _read_payload(request)
             try:
-                agent_id = observation.get("agent_id", "unknown")
-
-                logger.debug(f"[/observe] Processing observation for agent '{agent_id}'")
-
-                # Track observation for debug (no-op when disabled)
-                self._track_observation(observation)
-
-                # Parse observation
-                obs = Observation.from_dict(observation)
-
-                # Call user's decide callback
-                decision = self.decide_callback(obs)
-
-                # Record trace for debug (no-op when disabled)
-                self._record_decision_trace(agent_id, obs, decision)
+                result = await self._in_worker(self._decide_observation, observation)
 
                 # Update metrics
-                self.metrics["total_ticks"] += 1
-                self.metrics["total_observations"] += 1
+                self.total_ticks += 1
+                self.total_observations += 1
 
-                result = {
-                    "agent_id": agent_id,
-                    "tool": decision.tool,
-                    "params": decision.params,
-                    "reasoning": decision.reasoning or "Agent decision",
-                }
-
-                logger.debug(f"Agent {agent_id} decided: {decision.tool}")
-
-                return result
+                return _encode_response(request, result)
 
             except Exception as e:
-                logger.error(f"Error processing observation: {e}", exc_info=True)
+                logger.error("Error processing observation: %s", e, exc_info=True)
                 raise HTTPException(status_code=500, detail=str(e))
 
         @app.post("/tools/execute")
@@ -236,7 +455,7 @@ class MinimalIPCServer:
             tool_name = request_data.get("tool_name", "unknown")
             agent_id = request_data.get("agent_id", "unknown")
             logger.debug(
-                f"[/tools/execute] Acknowledging tool '{tool_name}' " f"for agent '{agent_id}'"
+                "[/tools/execute] Acknowledging tool '%s' for agent '%s'", tool_name, agent_id
             )
             return {
                 "success": True,
@@ -255,77 +474,53 @@ class MinimalIPCServer:
             agent_id = request_data.get("agent_id", "unknown")
             event_type = request_data.get("event_type", "unknown")
             description = request_data.get("description", "")
-            logger.info(f"[/experience] Agent '{agent_id}' event: " f"{event_type} - {description}")
+            logger.info(
+                "[/experience] Agent '%s' event: %s - %s", agent_id, event_type, description
+            )
             return {"success": True}
 
         @app.post("/tick")
-        async def process_tick(request_data: dict[str, Any]) -> dict[str, Any]:
+        async def process_tick(request: Request) -> Any:
             """
             Process a simulation tick.
 
             Receives observation(s), calls decide callback, returns action(s).
+            Accepts JSON or msgpack (``Content-Type: application/msgpack``).
             """
+            request_data = await _read_payload(request)
             try:
                 tick = request_data.get("tick", 0)
                 agents_data = request_data.get("agents", [])
 
-                logger.debug(f"Processing tick {tick} with {len(agents_data)} agents")
-
-                actions = []
-                for agent_data in agents_data:
-                    agent_id = agent_data.get("agent_id")
-                    obs_data = agent_data.get("observations", {})
-
-                    # Add agent_id and tick to observation data if not present
-                    if "agent_id" not in obs_data:
-                        obs_data["agent_id"] = agent_id
-                    if "tick" not in obs_data:
-                        obs_data["tick"] = tick
-
-                    # Track observation for debug (no-op when disabled)
-                    self._track_observation(obs_data)
+                logger.debug("Processing tick %s with %d agents", tick, len(agents_data))
 
-                    try:
-                        # Parse observation
-                        observation = Observation.from_dict(obs_data)
-
-                        # Call user's decide callback
-                        decision = self.decide_callback(observation)
-
-                        # Convert decision to action format
-                        action_data = {
-                            "agent_id": agent_id,
-                            "action": decision.to_dict(),
-                        }
-                        actions.append(action_data)
-
-                        logger.debug(f"Agent {agent_id} decided: {decision.tool}")
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error processing agent {agent_id}: {e}",
-                            exc_info=True,
+                if self.decide_batch_callback is not None:
+                    # One call for the whole tick, still off the event loop
+                    actions = await self._in_worker(
+                        self._decide_tick_batch, self.decide_batch_callback, agents_data, tick
+                    )
+                else:
+                    # Decide every agent on the worker pool; gather keeps request order
+                    actions = await asyncio.gather(
+                        *(
+                            self._in_worker(self._decide_tick_agent, agent_data, tick)
+                            for agent_data in agents_data
                         )
-                        # Fallback to idle
-                        action_data = {
-                            "agent_id": agent_id,
-                            "action": Decision.idle(reasoning=f"Error: {str(e)}").to_dict(),
-                        }
-                        actions.append(action_data)
+                    )
 
                 # Update metrics
-                self.metrics["total_ticks"] += 1
-                self.metrics["total_observations"] += len(agents_data)
+                self.total_ticks += 1
+                self.total_observations += len(agents_data)
 
                 response = {
                     "tick": tick,
                     "actions": actions,
                 }
 
-                return response
+                return _encode_response(request, response)
 
             except Exception as e:
-                logger.error(f"Error processing tick: {e}", exc_info=True)
+                logger.error("Error processing tick: %s", e, exc_info=True)
                 raise HTTPException(status_code=500, detail=str(e))
 
         # ---------------------------------------------------------------
@@ -343,11 +538,11 @@ class MinimalIPCServer:
         # -- Web UI --
 
         @app.get("/debug", response_class=HTMLResponse)
-        async def debug_viewer() -> str:
+        async def debug_viewer(request: Request) -> Response:
             """Serve the web-based trace viewer UI."""
-            from .web_ui import get_debug_viewer_html
+            from .web_ui import get_debug_viewer_response
 
-            return get_debug_viewer_html()
+            return get_debug_viewer_response(request)
 
         # -- Observations --
 
@@ -355,19 +550,20 @@ class MinimalIPCServer:
         async def get_observations(
             limit: int = Query(50, ge=1, le=1000),
             agent_id: str | None = Query(None),
-        ) -> dict[str, Any]:
+        ) -> Response:
             """Get recent observations with visibility tracking."""
             observations = self.observation_tracker.get_recent(limit, agent_id)
-            return {"observations": observations, "count": len(observations)}
+            # Already plain JSON types: skip FastAPI's response-model encoding pass
+            return JSONResponse({"observations": observations, "count": len(observations)})
 
         @app.get("/debug/changes")
         async def get_changes(
             limit: int = Query(50, ge=1, le=1000),
             agent_id: str | None = Query(None),
-        ) -> dict[str, Any]:
+        ) -> Response:
             """Get observations where visibility changed."""
             changes = self.observation_tracker.get_changes(limit, agent_id)
-            return {"changes": changes, "count": len(changes)}
+            return JSONResponse({"changes": changes, "count": len(changes)})
 
         @app.post("/debug/reset")
         async def reset_observations() -> dict[str, str]:
@@ -384,9 +580,9 @@ class MinimalIPCServer:
             tick_start: int | None = Query(None),
             tick_end: int | None = Query(None),
             tool: str | None = Query(None, description="Filter by decision tool name"),
-        ) -> dict[str, Any]:
+        ) -> Response:
             """Get recent reasoning traces from hybrid storage."""
-            traces = self.debug_store.get_recent_traces(
+            traces = self.debug_store.get_recent_trace_objects(
                 limit=limit,
                 agent_id=agent_id,
                 tick_start=tick_start,
@@ -397,11 +593,13 @@ class MinimalIPCServer:
                     t
                     for t in traces
                     if any(
-                        s.get("name") == "decision" and s.get("data", {}).get("tool") == tool
-                        for s in t.get("steps", [])
+                        s.name == "decision"
+                        and isinstance(s.data, dict)
+                        and s.data.get("tool") == tool
+                        for s in t.steps
                     )
                 ]
-            return {"traces": traces, "count": len(traces)}
+            return _traces_response(traces)
 
         @app.get("/debug/prompts")
         async def get_prompts(
@@ -425,8 +623,7 @@ class MinimalIPCServer:
             agents_set = set(self.debug_store.list_agents())
             # Also include agents seen by the observation tracker
             if self.observation_tracker is not None:
-                with self.observation_tracker._lock:
-                    agents_set.update(self.observation_tracker._last_visible.keys())
+                agents_set.update(self.observation_tracker.agent_ids())
             return {"agents": sorted(agents_set)}
 
         @app.get("/debug/episodes")
@@ -446,13 +643,14 @@ class MinimalIPCServer:
         if not self.app:
             self.create_app()
 
-        logger.info(f"Starting SDK IPC server at {self.host}:{self.port}")
+        logger.info("Starting SDK IPC server at %s:%s", self.host, self.port)
 
         uvicorn.run(
             self.app,
             host=self.host,
             port=self.port,
             log_level="info",
+            access_log=self.access_log,
         )
 
     async def run_async(self) -> None:
@@ -464,13 +662,14 @@ class MinimalIPCServer:
         if not self.app:
             self.create_app()
 
-        logger.info(f"Starting SDK IPC server at {self.host}:{self.port}")
+        logger.info("Starting SDK IPC server at %s:%s", self.host, self.port)
 
         config = uvicorn.Config(
             self.app,
             host=self.host,
             port=self.port,
             log_level="info",
+            access_log=self.access_log,
         )
         server = uvicorn.Server(config)
         await server.serve()
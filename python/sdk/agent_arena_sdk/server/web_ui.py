@@ -6,18 +6,29 @@ separated from Python code.
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
+from fastapi import Request
+from fastapi.responses import Response
+
 _STATIC_DIR = Path(__file__).parent / "static"
 _VIEWER_PATH = _STATIC_DIR / "debug_viewer.html"
 
-# Cache the file contents after first read
-_cached_html: str | None = None
+# The viewer is static, so it is read and hashed once when this module is
+# first imported (on the first /debug request).
+_CACHED_BYTES = _VIEWER_PATH.read_bytes()
+_ETAG = '"' + hashlib.blake2b(_CACHED_BYTES, digest_size=8).hexdigest() + '"'
+_HEADERS = {"ETag": _ETAG, "Cache-Control": "public, max-age=300"}
 
 
 def get_debug_viewer_html() -> str:
     """Return the HTML content of the debug trace viewer."""
-    global _cached_html  # noqa: PLW0603
-    if _cached_html is None:
-        _cached_html = _VIEWER_PATH.read_text(encoding="utf-8")
-    return _cached_html
+    return _CACHED_BYTES.decode("utf-8")
+
+
+def get_debug_viewer_response(request: Request) -> Response:
+    """Serve the viewer, or ``304 Not Modified`` if the client's copy is current."""
+    if request.headers.get("if-none-match") == _ETAG:
+        return Response(status_code=304, headers=_HEADERS)
+    return Response(content=_CACHED_BYTES, media_type="text/html", headers=_HEADERS)
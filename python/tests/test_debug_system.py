@@ -6,8 +6,9 @@ independently of the FastAPI server.
 
 from __future__ import annotations
 
+import pytest
 from agent_arena_sdk.server.debug_middleware import ObservationTracker
-from agent_arena_sdk.server.debug_store import DebugStore, DebugTrace
+from agent_arena_sdk.server.debug_store import DebugStore, DebugTrace, DebugTraceStep
 
 # ── Helpers ───────────────────────────────────────────────────
 
@@ -39,6 +40,21 @@ class TestObservationTracker:
         assert entry.tick == 1
         assert "berry_1" in entry.visible_resources
 
+    def test_timestamp_is_iso_utc(self) -> None:
+        entry = ObservationTracker().track_observation(_make_observation())
+        assert entry.timestamp.endswith("+00:00")  # ISO 8601, UTC
+        assert entry.to_dict()["timestamp"] == entry.timestamp
+
+    def test_to_dict_is_built_once(self) -> None:
+        entry = ObservationTracker().track_observation(_make_observation(resources=["berry_1"]))
+        assert entry.to_dict() is entry.to_dict()
+        assert entry.to_dict()["visible_resources"] == ["berry_1"]
+
+    def test_raw_observation_is_opt_in(self) -> None:
+        obs = _make_observation()
+        assert ObservationTracker().track_observation(obs).raw_observation is None
+        assert ObservationTracker(keep_raw=True).track_observation(obs).raw_observation is obs
+
     def test_gained_resources_on_first_observation(self) -> None:
         tracker = ObservationTracker()
         entry = tracker.track_observation(_make_observation(resources=["berry_1", "berry_2"]))
@@ -63,6 +79,20 @@ class TestObservationTracker:
         assert "berry_1" in entry3.lost_resources
         assert entry3.gained_resources == []
 
+    def test_interleaved_changes_are_sorted(self) -> None:
+        tracker = ObservationTracker()
+        tracker.track_observation(
+            _make_observation(tick=1, resources=["c", "a", "e"], hazards=["fire"])
+        )
+        entry = tracker.track_observation(
+            _make_observation(tick=2, resources=["d", "b", "a", "a"], hazards=["fire"])
+        )
+        assert entry.visible_resources == ["a", "b", "d"]
+        assert entry.gained_resources == ["b", "d"]
+        assert entry.lost_resources == ["c", "e"]
+        assert entry.gained_hazards == []
+        assert entry.lost_hazards == []
+
     def test_per_agent_tracking(self) -> None:
         tracker = ObservationTracker()
 
@@ -73,6 +103,22 @@ class TestObservationTracker:
         # Agent b should see r2 as gained (independent from agent a)
         assert "r2" in entry_b.gained_resources
 
+    def test_track_observations_batch(self) -> None:
+        tracker = ObservationTracker()
+        tracker.track_observation(_make_observation(agent_id="a", tick=1, resources=["r1"]))
+
+        entries = tracker.track_observations(
+            [
+                _make_observation(agent_id="a", tick=2, resources=["r2"]),
+                _make_observation(agent_id="b", tick=2, resources=["r1"]),
+            ]
+        )
+        assert [e.agent_id for e in entries] == ["a", "b"]
+        assert entries[0].gained_resources == ["r2"]
+        assert entries[0].lost_resources == ["r1"]
+        assert entries[1].gained_resources == ["r1"]
+        assert [o["tick"] for o in tracker.get_recent()] == [1, 2, 2]
+
     def test_get_recent(self) -> None:
         tracker = ObservationTracker()
         for i in range(5):
@@ -123,6 +169,13 @@ class TestObservationTracker:
         tracker.clear()
         assert tracker.get_recent() == []
 
+    def test_clear_resets_visibility_state(self) -> None:
+        tracker = ObservationTracker()
+        tracker.track_observation(_make_observation(tick=1, resources=["berry_1"]))
+        tracker.clear()
+        entry = tracker.track_observation(_make_observation(tick=2, resources=["berry_1"]))
+        assert entry.gained_resources == ["berry_1"]
+
     def test_has_changes_property(self) -> None:
         tracker = ObservationTracker()
         entry = tracker.track_observation(_make_observation(resources=["berry_1"]))
@@ -164,6 +217,37 @@ class TestDebugStore:
         assert len(recent) == 5
         assert recent[0]["tick"] == 5  # oldest kept
 
+    def test_agent_index_follows_ring_buffer_eviction(self) -> None:
+        store = DebugStore(max_memory_traces=4)
+        for tick in range(3):
+            for agent in ["a", "b", "c"]:
+                store.record_trace(DebugTrace(agent_id=agent, tick=tick))
+        store.record_trace(DebugTrace(agent_id="d", tick=3))
+        store.record_trace(DebugTrace(agent_id="d", tick=4))
+
+        # Buffer holds b@2, c@2, d@3, d@4; a has been evicted entirely
+        assert sum(len(traces) for traces in store._by_agent.values()) == 4
+        assert store.get_recent_traces(agent_id="a") == []
+        assert [t["tick"] for t in store.get_recent_traces(agent_id="b")] == [2]
+        assert [t["tick"] for t in store.get_recent_traces(agent_id="d")] == [3, 4]
+        assert store.list_agents() == ["b", "c", "d"]
+
+    def test_limit_keeps_newest_in_tick_range(self) -> None:
+        store = DebugStore()
+        for tick in range(20):
+            store.record_trace(DebugTrace(agent_id="a", tick=tick))
+
+        recent = store.get_recent_traces(limit=3, tick_end=10)
+        assert [t["tick"] for t in recent] == [8, 9, 10]
+
+    def test_recent_trace_objects_are_shared(self) -> None:
+        store = DebugStore()
+        trace = DebugTrace(agent_id="a", tick=1)
+        store.record_trace(trace)
+
+        assert store.get_recent_trace_objects(agent_id="a") == [trace]
+        assert store.get_recent_trace_objects(agent_id="a")[0] is trace
+
     def test_filter_by_agent(self) -> None:
         store = DebugStore()
 
@@ -208,6 +292,20 @@ class TestDebugStore:
         step1 = trace.add_step("observation", {"data": 1})
         assert step1.elapsed_ms >= 0
 
+    def test_step_timing_is_relative_to_start(self) -> None:
+        trace = DebugTrace(agent_id="a", tick=1, start_time=1000.0)
+        first = trace.add_step("observation", {})
+        second = trace.add_step("decision", {})
+
+        assert first.elapsed_ms >= 0.0
+        assert second.elapsed_ms >= first.elapsed_ms
+        assert second.timestamp == pytest.approx(1000.0 + second.elapsed_ms / 1000)
+
+    def test_trace_ids_are_unique(self) -> None:
+        ids = {DebugTrace(agent_id="a", tick=i).trace_id for i in range(100)}
+        assert len(ids) == 100
+        assert DebugTrace.from_dict({"agent_id": "a", "tick": 1}).trace_id not in ids
+
     def test_debug_trace_to_dict_roundtrip(self) -> None:
         trace = DebugTrace(agent_id="a", tick=42, episode_id="ep1")
         trace.add_step("observation", {"pos": [1, 2, 3]})
@@ -221,6 +319,22 @@ class TestDebugStore:
         assert len(trace2.steps) == 2
         assert trace2.steps[0].name == "observation"
         assert trace2.steps[1].data == {"tool": "move_to"}
+        assert trace2.steps == trace.steps
+
+    def test_step_serialization_handles_nested_and_custom_types(self) -> None:
+        class Tag(str):
+            pass
+
+        step = DebugTraceStep(
+            name="parse",
+            data={"pos": (1, 2.5, None), 3: [{"ok": True}], "tag": Tag("x"), "obj": object},
+        )
+
+        data = step.to_dict()["data"]
+        assert data["pos"] == [1, 2.5, None]
+        assert data["3"] == [{"ok": True}]
+        assert data["tag"] == "x"
+        assert data["obj"] == str(object)
 
     def test_captures_empty_without_runtime(self) -> None:
         """get_captures should return [] when agent_runtime is not available."""
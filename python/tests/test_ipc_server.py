@@ -0,0 +1,302 @@
+"""Tests for the SDK MinimalIPCServer HTTP endpoints."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import msgpack
+import pytest
+from agent_arena_sdk import Decision, Observation
+from agent_arena_sdk.server import ipc_server
+from agent_arena_sdk.server.debug_store import DebugTrace
+from agent_arena_sdk.server.ipc_server import MinimalIPCServer
+from fastapi.testclient import TestClient
+
+# ── Helpers ───────────────────────────────────────────────────
+
+
+def _decide(obs: Observation) -> Decision:
+    """Collect the first nearby resource, otherwise idle."""
+    if obs.nearby_resources:
+        return Decision(tool="collect", params={"target": obs.nearby_resources[0].name})
+    return Decision.idle(reasoning="nothing nearby")
+
+
+def _make_observation(agent_id: str = "agent_1", tick: int = 1) -> dict[str, Any]:
+    """Build a minimal observation dict for testing."""
+    return {
+        "agent_id": agent_id,
+        "tick": tick,
+        "position": [1.0, 0.0, 2.0],
+        "nearby_resources": [
+            {"name": "berry_1", "type": "berry", "position": [2.0, 0.0, 2.0], "distance": 1.0}
+        ],
+    }
+
+
+@pytest.fixture
+def client() -> TestClient:
+    server = MinimalIPCServer(decide_callback=_decide)
+    return TestClient(server.create_app())
+
+
+# ── Endpoints ─────────────────────────────────────────────────
+
+
+class TestObserveEndpoint:
+    def test_observe_returns_decision(self, client: TestClient) -> None:
+        response = client.post("/observe", json=_make_observation())
+        assert response.status_code == 200
+        body = response.json()
+        assert body["agent_id"] == "agent_1"
+        assert body["tool"] == "collect"
+        assert body["params"] == {"target": "berry_1"}
+
+    def test_json_encoding_matches_without_orjson(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        fast = client.post("/observe", json=_make_observation())
+        monkeypatch.setattr(ipc_server, "orjson", None)
+        plain = client.post("/observe", json=_make_observation())
+        assert fast.headers["content-type"].startswith("application/json")
+        assert plain.headers["content-type"].startswith("application/json")
+        assert fast.json() == plain.json()
+
+
+class TestTickEndpoint:
+    def test_tick_returns_action_per_agent(self, client: TestClient) -> None:
+        response = client.post(
+            "/tick",
+            json={
+                "tick": 7,
+                "agents": [
+                    {"agent_id": "a", "observations": {"position": [0.0, 0.0, 0.0]}},
+                    {"agent_id": "b", "observations": _make_observation("b", 7)},
+                ],
+            },
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["tick"] == 7
+        assert [a["agent_id"] for a in body["actions"]] == ["a", "b"]
+        assert body["actions"][0]["action"]["tool"] == "idle"
+        assert body["actions"][1]["action"]["tool"] == "collect"
+
+    def test_tick_agent_without_id_still_decides(self, client: TestClient) -> None:
+        observation = _make_observation()
+        del observation["agent_id"]
+        response = client.post("/tick", json={"tick": 1, "agents": [{"observations": observation}]})
+        action = response.json()["actions"][0]
+        assert action["agent_id"] is None
+        assert action["action"]["tool"] == "collect"
+
+    def test_tick_and_observe_update_metrics(self) -> None:
+        server = MinimalIPCServer(decide_callback=_decide)
+        client = TestClient(server.create_app())
+        client.post("/observe", json=_make_observation())
+        agents = [{"agent_id": i, "observations": _make_observation(i)} for i in "abc"]
+        client.post("/tick", json={"tick": 2, "agents": agents})
+        assert server.metrics == {"total_ticks": 2, "total_observations": 4}
+
+    def test_tick_decides_agents_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def decide(obs: Observation) -> Decision:
+            barrier.wait()  # Only passes if both agents are decided at once
+            return Decision.idle()
+
+        server = MinimalIPCServer(decide_callback=decide, max_workers=2)
+        response = TestClient(server.create_app()).post(
+            "/tick",
+            json={
+                "tick": 1,
+                "agents": [
+                    {"agent_id": "a", "observations": _make_observation("a")},
+                    {"agent_id": "b", "observations": _make_observation("b")},
+                ],
+            },
+        )
+        actions = response.json()["actions"]
+        assert [a["agent_id"] for a in actions] == ["a", "b"]
+        assert all(a["action"]["tool"] == "idle" for a in actions)
+        assert all("Error" not in a["action"].get("reasoning", "") for a in actions)
+
+
+class TestBatchDecide:
+    def _tick(self, server: MinimalIPCServer) -> list[dict[str, Any]]:
+        response = TestClient(server.create_app()).post(
+            "/tick",
+            json={
+                "tick": 2,
+                "agents": [
+                    {"agent_id": "a", "observations": _make_observation("a", 2)},
+                    {"agent_id": "bad", "observations": {"tick": 2}},  # no position
+                    {"agent_id": "c", "observations": _make_observation("c", 2)},
+                ],
+            },
+        )
+        return response.json()["actions"]
+
+    def test_tick_uses_one_batch_call(self) -> None:
+        calls: list[list[str]] = []
+
+        def decide_batch(batch: list[Observation]) -> list[Decision]:
+            calls.append([obs.agent_id for obs in batch])
+            return [_decide(obs) for obs in batch]
+
+        server = MinimalIPCServer(decide_callback=_decide, decide_batch_callback=decide_batch)
+        actions = self._tick(server)
+
+        assert calls == [["a", "c"]]
+        assert [a["agent_id"] for a in actions] == ["a", "bad", "c"]
+        assert [a["action"]["tool"] for a in actions] == ["collect", "idle", "collect"]
+
+    def test_batch_tick_tracks_every_agent(self) -> None:
+        def decide_batch(batch: list[Observation]) -> list[Decision]:
+            return [_decide(obs) for obs in batch]
+
+        server = MinimalIPCServer(
+            decide_callback=_decide, decide_batch_callback=decide_batch, enable_debug=True
+        )
+        self._tick(server)
+
+        tracked = server.observation_tracker.get_recent()
+        assert [(o["agent_id"], o["tick"]) for o in tracked] == [("a", 2), ("bad", 2), ("c", 2)]
+
+    def test_batch_failure_idles_every_agent(self) -> None:
+        def decide_batch(batch: list[Observation]) -> list[Decision]:
+            return [Decision.idle()]  # Wrong length
+
+        server = MinimalIPCServer(decide_callback=_decide, decide_batch_callback=decide_batch)
+        actions = self._tick(server)
+
+        assert [a["action"]["tool"] for a in actions] == ["idle", "idle", "idle"]
+        assert "decisions for 2 observations" in actions[0]["action"]["reasoning"]
+
+
+class TestDebugEndpoints:
+    def test_observations_returns_newest_for_agent(self) -> None:
+        server = MinimalIPCServer(decide_callback=_decide, enable_debug=True)
+        client = TestClient(server.create_app())
+        for tick, agent_id in [(1, "a"), (2, "b"), (3, "a"), (4, "a")]:
+            client.post("/observe", json=_make_observation(agent_id, tick))
+
+        body = client.get("/debug/observations", params={"limit": 2, "agent_id": "a"}).json()
+        assert body["count"] == 2
+        assert [o["tick"] for o in body["observations"]] == [3, 4]
+
+    def test_agents_lists_observed_agents(self) -> None:
+        server = MinimalIPCServer(decide_callback=_decide, enable_debug=True)
+        client = TestClient(server.create_app())
+        for agent_id in ["b", "a"]:
+            client.post("/observe", json=_make_observation(agent_id, 1))
+
+        response = client.get("/debug/agents")
+        assert response.status_code == 200
+        assert response.json() == {"agents": ["a", "b"]}
+
+    def test_raw_observations_are_opt_in(self) -> None:
+        for keep_raw in (False, True):
+            server = MinimalIPCServer(
+                decide_callback=_decide, enable_debug=True, debug_keep_raw=keep_raw
+            )
+            client = TestClient(server.create_app())
+            client.post("/observe", json=_make_observation("a", 1))
+
+            observation = client.get("/debug/observations").json()["observations"][0]
+            assert (observation["raw_observation"] is not None) is keep_raw
+
+    def test_observe_records_decision_trace(self) -> None:
+        server = MinimalIPCServer(decide_callback=_decide, enable_debug=True)
+        client = TestClient(server.create_app())
+        client.post("/observe", json=_make_observation("a", 5))
+
+        trace = client.get("/debug/traces").json()["traces"][0]
+        assert trace["tick"] == 5
+        observation, decision = trace["steps"]
+        assert observation["data"]["position"] == [1.0, 0.0, 2.0]
+        assert observation["data"]["nearby_resources"] == 1
+        assert decision["data"]["tool"] == "collect"
+
+    def test_viewer_revalidates_with_etag(self) -> None:
+        server = MinimalIPCServer(decide_callback=_decide, enable_debug=True)
+        client = TestClient(server.create_app())
+        first = client.get("/debug")
+        assert first.status_code == 200
+        assert first.headers["content-type"].startswith("text/html")
+
+        etag = first.headers["etag"]
+        again = client.get("/debug", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+
+    def test_traces_filter_by_tool_with_and_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server = MinimalIPCServer(decide_callback=_decide, enable_debug=True)
+        client = TestClient(server.create_app())
+        for tick, tool in [(1, "collect"), (2, "idle"), (3, "collect")]:
+            trace = DebugTrace(agent_id="a", tick=tick)
+            trace.add_step("decision", {"tool": tool})
+            server.debug_store.record_trace(trace)
+
+        fast = client.get("/debug/traces", params={"tool": "collect"}).json()
+        monkeypatch.setattr(ipc_server, "orjson", None)
+        plain = client.get("/debug/traces", params={"tool": "collect"}).json()
+        assert fast == plain
+        assert fast["count"] == 2
+        assert [t["tick"] for t in fast["traces"]] == [1, 3]
+        assert fast["traces"][0]["steps"][0]["data"] == {"tool": "collect"}
+
+
+class TestMsgpackPayloads:
+    def test_observe_msgpack_roundtrip(self, client: TestClient) -> None:
+        response = client.post(
+            "/observe",
+            content=msgpack.packb(_make_observation()),
+            headers={"Content-Type": "application/msgpack"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        body = msgpack.unpackb(response.content)
+        assert body["tool"] == "collect"
+
+    def test_tick_msgpack_roundtrip(self, client: TestClient) -> None:
+        payload = {"tick": 3, "agents": [{"agent_id": "a", "observations": _make_observation()}]}
+        response = client.post(
+            "/tick",
+            content=msgpack.packb(payload),
+            headers={"Content-Type": "application/msgpack"},
+        )
+        assert response.status_code == 200
+        body = msgpack.unpackb(response.content)
+        assert body["tick"] == 3
+        assert body["actions"][0]["action"]["tool"] == "collect"
+
+    def test_json_request_can_accept_msgpack(self, client: TestClient) -> None:
+        response = client.post(
+            "/observe", json=_make_observation(), headers={"Accept": "application/msgpack"}
+        )
+        assert msgpack.unpackb(response.content)["agent_id"] == "agent_1"
+
+    def test_invalid_body_is_bad_request(self, client: TestClient) -> None:
+        response = client.post(
+            "/observe", content=b"\xc1", headers={"Content-Type": "application/msgpack"}
+        )
+        assert response.status_code == 400
+
+
+# ── Server lifecycle ──────────────────────────────────────────
+
+
+class TestRun:
+    def test_access_log_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[dict[str, Any]] = []
+        monkeypatch.setattr(ipc_server.uvicorn, "run", lambda app, **kw: calls.append(kw))
+
+        MinimalIPCServer(decide_callback=_decide).run()
+        MinimalIPCServer(decide_callback=_decide, access_log=True).run()
+
+        assert calls[0]["access_log"] is False
+        assert calls[1]["access_log"] is True
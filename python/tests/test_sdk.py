@@ -110,6 +110,26 @@ class TestObjective:
         assert reconstructed.time_limit == original.time_limit
         assert "score" in reconstructed.success_metrics
 
+    def test_objective_to_dict_omits_defaults(self):
+        """Test default metric and time-limit fields are left out of to_dict."""
+        original = Objective(
+            description="Collect",
+            success_metrics={
+                "collected": MetricDefinition(target=10.0),
+                "time_taken": MetricDefinition(target=60.0, lower_is_better=True),
+            },
+        )
+
+        obj_dict = original.to_dict()
+
+        assert "time_limit" not in obj_dict
+        assert obj_dict["success_metrics"]["collected"] == {"target": 10.0}
+        assert obj_dict["success_metrics"]["time_taken"] == {
+            "target": 60.0,
+            "lower_is_better": True,
+        }
+        assert Objective.from_dict(obj_dict) == original
+
 
 class TestObservation:
     """Tests for Observation schema."""
@@ -168,6 +188,24 @@ class TestObservation:
         assert obs.objective is None
         assert obs.current_progress == {}
 
+    def test_from_dict_keeps_non_string_ids(self):
+        """Test from_dict passes through ids and names that are not strings."""
+        obs = Observation.from_dict(
+            {
+                "agent_id": None,
+                "tick": 1,
+                "position": [0.0, 0.0, 0.0],
+                "scenario_name": None,
+                "visible_entities": [
+                    {"id": 7, "type": "tree", "position": [1.0, 0.0, 0.0], "distance": 1.0}
+                ],
+            }
+        )
+
+        assert obs.agent_id is None
+        assert obs.scenario_name is None
+        assert obs.visible_entities[0].id == 7
+
     def test_observation_serialization(self):
         """Test observation to_dict and from_dict with objective."""
         objective = Objective(
@@ -17,6 +17,32 @@ from huggingface_hub import hf_hub_download  # type: ignore[import-untyped]
 
 logger = logging.getLogger(__name__)
 
+# Memory needed to run a GGUF model, as a multiple of its file size
+# (KV cache, compute buffers and CUDA context on top of the weights)
+VRAM_OVERHEAD = 1.2
+
+
+def get_free_vram_bytes(device_index: int = 0) -> int | None:
+    """
+    Return the free memory of an NVIDIA GPU in bytes.
+
+    Returns None when pynvml is not installed or no NVIDIA GPU is available.
+    """
+    try:
+        import pynvml  # type: ignore[import-untyped]
+    except ImportError:
+        return None
+
+    try:
+        pynvml.nvmlInit()
+        try:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(device_index)
+            return int(pynvml.nvmlDeviceGetMemoryInfo(handle).free)
+        finally:
+            pynvml.nvmlShutdown()
+    except pynvml.NVMLError:
+        return None
+
 
 @dataclass
 class ModelInfo:
@@ -332,6 +358,57 @@ class ModelManager:
 
         return None
 
+    def select_quantization(
+        self, model_id: str, free_vram_bytes: int | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Pick the best cached GGUF quantization of a model for this GPU.
+
+        Chooses the largest variant that fits in free VRAM (file size times
+        VRAM_OVERHEAD), since larger quantizations give better quality. If
+        none fits, or the free VRAM is unknown, the smallest variant is
+        chosen: it is the fastest, and partially offloading a model to the
+        CPU costs far more than the quality a bigger quantization adds.
+
+        Args:
+            model_id: Model identifier (directory under models/)
+            free_vram_bytes: Free GPU memory; detected with pynvml if None
+
+        Returns:
+            The chosen entry from list_models(), or None if no GGUF is cached
+        """
+        candidates = sorted(
+            (
+                m
+                for m in self.list_models(format_filter="gguf")
+                if m["model"] == model_id and m["file"].endswith(".gguf")
+            ),
+            key=lambda m: m["size_bytes"],
+        )
+        if not candidates:
+            return None
+
+        if free_vram_bytes is None:
+            free_vram_bytes = get_free_vram_bytes()
+        if free_vram_bytes is None:
+            logger.info(f"Free VRAM unknown, using smallest quantization of {model_id}")
+            return candidates[0]
+
+        fitting = [m for m in candidates if m["size_bytes"] * VRAM_OVERHEAD <= free_vram_bytes]
+        if not fitting:
+            logger.warning(
+                f"No quantization of {model_id} fits in {free_vram_bytes / 1024**3:.1f} GB "
+                f"free VRAM; using the smallest, part of it will run on CPU"
+            )
+            return candidates[0]
+
+        chosen = fitting[-1]
+        logger.info(
+            f"Selected {model_id} {chosen['quantization']} ({chosen['size_gb']:.1f} GB) "
+            f"for {free_vram_bytes / 1024**3:.1f} GB free VRAM"
+        )
+        return chosen
+
     def remove_model(
         self, model_id: str, format: str | None = None, quantization: str | None = None
     ) -> bool:
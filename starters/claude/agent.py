@@ -97,6 +97,11 @@ class ClaudeAdapter(FrameworkAdapter):
         )
         self.system_prompt = SYSTEM_PROMPT
 
+        # Convert our ToolSchema objects to Anthropic's format once:
+        #   {"name": ..., "description": ..., "input_schema": {...}}
+        # The toolset is fixed, so there's no need to rebuild it every tick.
+        self.tools = [t.to_anthropic_format() for t in self.get_action_tools()]
+
         # Chain-of-thought trace for the debug viewer.
         # The SDK's debug system reads this via adapter.last_trace.
         self.last_trace: dict | None = None
@@ -113,10 +118,6 @@ class ClaudeAdapter(FrameworkAdapter):
         # --- Build prompt -------------------------------------------------
         obs_text = self.format_observation(obs)
 
-        # Convert our ToolSchema objects to Anthropic's format:
-        #   {"name": ..., "description": ..., "input_schema": {...}}
-        tools = [t.to_anthropic_format() for t in self.get_action_tools()]
-
         # Trace dict for the debug viewer
         trace: dict = {
             "system_prompt": self.system_prompt,
@@ -135,7 +136,7 @@ class ClaudeAdapter(FrameworkAdapter):
                 max_tokens=self.max_tokens,
                 system=self.system_prompt,
                 messages=[{"role": "user", "content": obs_text}],
-                tools=tools,
+                tools=self.tools,
             )
 
             trace["tokens_used"] = (
@@ -16,6 +16,7 @@ from llm_client import LLMClient
 from pathlib import Path
 import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -35,14 +36,24 @@ class Agent:
         self,
         model_path: str = "models/llama-2-7b/gguf/q4/model.gguf",
         llm_client: LLMClient | None = None,
+        api_base: str | None = None,
+        flash_attn: bool = False,
+        kv_cache_type: str = "f16",
+        prompt_lookup_tokens: int = 0,
     ):
         """
         Initialize LLM agent.
 
         Args:
-            model_path: Path to GGUF model file
+            model_path: Path to GGUF model file (or served model name with api_base)
             llm_client: Optional pre-configured LLMClient (for testing/DI).
                          If provided, *model_path* is ignored.
+            api_base: Optional OpenAI-compatible server URL (e.g. a vLLM server)
+                to use instead of loading the model locally
+            flash_attn: Enable flash attention when loading the model locally
+            kv_cache_type: KV cache precision for a local model ("f16", "q8_0", "q4_0")
+            prompt_lookup_tokens: Draft tokens per step for prompt lookup
+                (speculative) decoding with a local model; 0 disables it
         """
         # Initialize memory
         self.memory = SlidingWindowMemory(capacity=20)
@@ -53,7 +64,14 @@ class Agent:
         else:
             logger.info("Initializing LLM client...")
             self.llm = LLMClient(
-                model_path=model_path, temperature=0.3, max_tokens=256, n_gpu_layers=-1  # Use GPU
+                model_path=model_path,
+                temperature=0.3,
+                max_tokens=256,
+                n_gpu_layers=-1,  # Use GPU
+                api_base=api_base,
+                flash_attn=flash_attn,
+                kv_cache_type=kv_cache_type,
+                prompt_lookup_tokens=prompt_lookup_tokens,
             )
 
         # Load prompts
@@ -63,11 +81,21 @@ class Agent:
         with open(prompts_dir / "decision.txt") as f:
             self.decision_template = f.read()
 
-        # Chain-of-thought trace for debug viewer
-        self.last_trace = None
+        # Chain-of-thought trace for debug viewer (one per thread, so agents
+        # decided concurrently by AgentArena(max_workers=...) keep their own)
+        self._local = threading.local()
 
         logger.info("LLM agent initialized")
 
+    @property
+    def last_trace(self) -> dict | None:
+        """Trace of the last decision made on the calling thread."""
+        return getattr(self._local, "trace", None)
+
+    @last_trace.setter
+    def last_trace(self, trace: dict | None) -> None:
+        self._local.trace = trace
+
     def decide(self, obs: Observation) -> Decision:
         """
         Make a decision using the LLM.
@@ -97,7 +125,13 @@ class Agent:
 
         # Generate LLM response (pass system prompt separately for chat formatting)
         try:
-            response = self.llm.generate(prompt=prompt, system_prompt=self.system_prompt)
+            # The prompt asks for a single JSON object, so stop decoding once it closes
+            response = self.llm.generate(
+                prompt=prompt,
+                system_prompt=self.system_prompt,
+                stop_after_json=True,
+                json_schema=self.DECISION_SCHEMA,
+            )
 
             trace["llm_raw_output"] = response.get("text", "")
             trace["tokens_used"] = response.get("tokens_used", 0)
@@ -267,6 +301,17 @@ class Agent:
     # Valid tool names the agent can use
     VALID_TOOLS = {"move_to", "collect", "idle", "craft_item"}
 
+    # Shape of the JSON the model must produce (enforced during decoding)
+    DECISION_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "tool": {"type": "string", "enum": sorted(VALID_TOOLS)},
+            "params": {"type": "object"},
+            "reasoning": {"type": "string"},
+        },
+        "required": ["tool", "params", "reasoning"],
+    }
+
     # Minimum safe distance from hazards
     HAZARD_SAFE_DISTANCE = 3.0
 
@@ -391,7 +436,7 @@ class Agent:
                             trace["parsed_json"] = data
                         return Decision(tool="idle", params={}, reasoning=reasoning)
 
-                logger.debug(f"LLM returned invalid tool '{tool}', using observation fallback")
+                logger.debug("LLM returned invalid tool '%s', using observation fallback", tool)
 
         # Observation-based fallback: always make a useful decision from the data
         if trace:
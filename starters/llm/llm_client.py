@@ -6,21 +6,88 @@ You can see exactly how it works and modify it!
 
 Supports:
 - llama.cpp backend (GGUF models)
+- vLLM (or any OpenAI-compatible server) via api_base
 - Automatic tool calling
 
 Requirements:
     pip install llama-cpp-python
+    # or, for a vLLM server started with python/run_vllm_server.py:
+    pip install requests
 """
 
 import json
 import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
 from typing import Any, cast
+from urllib.parse import urlparse
 
 from agent_arena_sdk import ToolSchema
 
 logger = logging.getLogger(__name__)
 
 
+def default_n_threads() -> int:
+    """Return a llama.cpp thread count for this host: one per core, at most 16."""
+    return min(16, os.cpu_count() or 4)
+
+
+class JsonObjectTracker:
+    """
+    Tracks streamed text and reports when the first top-level JSON object closes.
+
+    Braces inside JSON strings (and escaped quotes) are ignored, so
+    ``{"reasoning": "go {north}"}`` closes at the final brace.
+
+    With ``after`` set (e.g. ``"ACTION:"`` for chain-of-thought prompts), only
+    braces following that marker count, so free-form thinking before it
+    cannot end the response early. The marker is matched case-insensitively.
+    """
+
+    def __init__(self, after: str | None = None):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.after = after.lower() if after else None
+        self._before_marker = ""
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk of text; return True once the first object has closed."""
+        if self.after is not None:
+            # Search across chunk boundaries; keep only a marker-sized tail
+            text = self._before_marker + chunk
+            index = text.lower().find(self.after)
+            if index == -1:
+                self._before_marker = text[-len(self.after) :]
+                return False
+            chunk = text[index + len(self.after) :]
+            self.after = None
+
+        for char in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"' and self.depth > 0:
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+            elif char == "}" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
 class LLMClient:
     """
     Simple LLM client using local models via llama-cpp-python.
@@ -34,6 +101,12 @@ class LLMClient:
     Example:
         client = LLMClient(model_path="models/llama-2-7b/gguf/q4/model.gguf")
 
+        # Or use a running vLLM server (batches requests on the GPU)
+        client = LLMClient(
+            model_path="meta-llama/Llama-2-7b-chat-hf",
+            api_base="http://localhost:8000/v1",
+        )
+
         response = client.generate(
             prompt="What should I do?",
             tools=[...tool schemas...]
@@ -50,51 +123,251 @@ class LLMClient:
         n_gpu_layers: int = -1,  # -1 = all layers on GPU
         top_p: float = 0.9,
         top_k: int = 40,
+        api_base: str | None = None,
+        n_threads: int | None = None,
+        n_batch: int = 2048,
+        flash_attn: bool = False,
+        kv_cache_type: str = "f16",
+        prompt_lookup_tokens: int = 0,
+        schema_format: str = "json_schema",
     ):
         """
         Initialize LLM client.
 
         Args:
-            model_path: Path to GGUF model file
+            model_path: Path to GGUF model file, or the served model name
+                when api_base is set
             temperature: Sampling temperature (0-1, higher = more creative)
             max_tokens: Maximum tokens to generate
             n_gpu_layers: Number of layers on GPU (-1 = all, 0 = CPU only)
             top_p: Top-p sampling parameter
             top_k: Top-k sampling parameter
+            api_base: Base URL of an OpenAI-compatible server such as vLLM
+                (e.g. "http://localhost:8000/v1"). If set, no local model is loaded.
+            n_threads: CPU threads for generation (default: CPU count, capped at 16)
+            n_batch: Prompt tokens evaluated per batch; larger batches speed up
+                prefill of long prompts
+            flash_attn: Use llama.cpp's flash attention kernels (runs attention on
+                tensor cores on recent NVIDIA GPUs; needs a CUDA build)
+            kv_cache_type: Precision of the KV cache: "f16", "q8_0" or "q4_0".
+                "q8_0" halves its memory with little quality loss, leaving VRAM
+                for model layers. llama.cpp only quantizes the V half of the
+                cache when flash_attn is on.
+            prompt_lookup_tokens: Speculatively draft this many tokens per step by
+                copying matching text from the prompt (0 = off). Decisions echo
+                names and positions from the observation, so drafts are often
+                accepted and several tokens are decoded per forward pass.
+            schema_format: How a server is sent a JSON schema: "json_schema"
+                (OpenAI structured outputs, used by vLLM) or "json_object"
+                (llama-cpp-python's server). A local model always uses the latter.
         """
         self.model_path = model_path
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.top_p = top_p
         self.top_k = top_k
+        self.api_base = api_base.rstrip("/") if api_base else None
+        if schema_format not in ("json_schema", "json_object"):
+            raise ValueError(f"Unknown schema_format: {schema_format}")
+        self.schema_format = schema_format
         self.llm = None
+        self.session = None
+        self._llm_lock = threading.Lock()
+
+        if self.api_base:
+            try:
+                import requests
+            except ImportError:
+                raise RuntimeError("requests not installed. Install with: pip install requests")
+
+            # Reuse one HTTP connection for every tick
+            self.session = requests.Session()
+            logger.info(f"Using OpenAI-compatible server at {self.api_base} (model: {model_path})")
+            return
 
         try:
+            import llama_cpp
             from llama_cpp import Llama
+        except ImportError:
+            raise RuntimeError(
+                "llama-cpp-python not installed. Install with: pip install llama-cpp-python"
+            )
 
-            logger.info(f"Loading model from {model_path}")
+        logger.info(f"Loading model from {model_path}")
 
-            if n_gpu_layers == -1:
-                logger.info("Offloading all layers to GPU")
-            elif n_gpu_layers > 0:
-                logger.info(f"Offloading {n_gpu_layers} layers to GPU")
-            else:
-                logger.info("Using CPU only (no GPU offload)")
+        if any(tag in Path(model_path).name.lower() for tag in ("f16", "bf16", "f32")):
+            logger.warning(
+                "Loading an unquantized GGUF. Decoding is memory-bandwidth bound, so a "
+                "Q4_K_M or Q5_K_M file of the same model is about twice as fast "
+                "(python -m tools.model_manager download ... --quant q4_k_m)"
+            )
+
+        # Not available in older llama-cpp-python releases; skip the check there
+        supports_gpu_offload = getattr(llama_cpp, "llama_supports_gpu_offload", None)
+        if n_gpu_layers != 0 and supports_gpu_offload is not None and not supports_gpu_offload():
+            logger.warning(
+                "llama-cpp-python was built without GPU support; running on CPU. "
+                'Reinstall with CMAKE_ARGS="-DGGML_CUDA=on" for GPU inference.'
+            )
 
+        if n_gpu_layers == -1:
+            logger.info("Offloading all layers to GPU")
+        elif n_gpu_layers > 0:
+            logger.info(f"Offloading {n_gpu_layers} layers to GPU")
+        else:
+            logger.info("Using CPU only (no GPU offload)")
+
+        if n_threads is None:
+            n_threads = default_n_threads()
+        logger.info(f"Using {n_threads} CPU threads, batch size {n_batch}")
+
+        # Optional features are only passed when enabled, so the defaults keep
+        # working on llama-cpp-python releases that predate them.
+        options: dict[str, Any] = {}
+        if flash_attn:
+            options["flash_attn"] = True
+        if kv_cache_type != "f16":
+            cache_type = getattr(llama_cpp, f"GGML_TYPE_{kv_cache_type.upper()}", None)
+            if cache_type is None:
+                raise ValueError(f"Unknown kv_cache_type: {kv_cache_type}")
+            logger.info(f"KV cache type: {kv_cache_type}")
+            options["type_k"] = cache_type
+            if flash_attn:
+                options["type_v"] = cache_type
+        if prompt_lookup_tokens > 0:
+            try:
+                from llama_cpp.llama_speculative import LlamaPromptLookupDecoding
+            except ImportError:
+                raise RuntimeError(
+                    f"llama-cpp-python {llama_cpp.__version__} has no prompt lookup "
+                    "decoding. Upgrade with: pip install -U llama-cpp-python"
+                )
+
+            options["draft_model"] = LlamaPromptLookupDecoding(num_pred_tokens=prompt_lookup_tokens)
+            logger.info(f"Prompt lookup decoding: {prompt_lookup_tokens} draft tokens")
+
+        try:
             self.llm = Llama(
                 model_path=model_path,
                 n_ctx=4096,
-                n_threads=8,
+                n_threads=n_threads,
+                n_threads_batch=n_threads,
+                n_batch=n_batch,
                 n_gpu_layers=n_gpu_layers,
                 verbose=False,
+                **options,
             )
+        except TypeError as e:
+            # An option this llama-cpp-python release does not know yet
+            raise RuntimeError(
+                f"llama-cpp-python {llama_cpp.__version__} is too old for these "
+                f"options ({e}). Upgrade with: pip install -U llama-cpp-python"
+            ) from e
 
-            logger.info("Model loaded successfully")
+        logger.info("Model loaded successfully")
 
-        except ImportError:
-            raise RuntimeError(
-                "llama-cpp-python not installed. Install with: pip install llama-cpp-python"
-            )
+    @classmethod
+    def connect_or_spawn(
+        cls,
+        model_path: str,
+        api_base: str = "http://localhost:8080/v1",
+        n_gpu_layers: int = -1,
+        startup_timeout: float = 300.0,
+        **kwargs: Any,
+    ) -> "LLMClient":
+        """
+        Connect to a llama.cpp server, starting one in the background if needed.
+
+        The server (``python -m llama_cpp.server``) is detached from this
+        process, so the model stays loaded when your agent script restarts.
+        The next run connects in milliseconds instead of reloading the weights.
+        Stop the server yourself when you are done iterating.
+
+        Args:
+            model_path: Path to GGUF model file
+            api_base: URL the server listens on (host and port are used to start it)
+            n_gpu_layers: Number of layers on GPU (-1 = all, 0 = CPU only)
+            startup_timeout: Seconds to wait for a newly started server to load
+            **kwargs: Passed to LLMClient (temperature, max_tokens, ...)
+
+        Returns:
+            An LLMClient talking to the server
+        """
+        import requests
+
+        api_base = api_base.rstrip("/")
+
+        def served_models() -> list[str] | None:
+            """Model ids the server at api_base serves, or None if nothing answers."""
+            try:
+                response = requests.get(f"{api_base}/models", timeout=1)
+                if not response.ok:
+                    return None
+                return [m.get("id") for m in response.json().get("data", [])]
+            except (requests.RequestException, ValueError):
+                return None
+
+        models = served_models()
+        if models is not None:
+            # Something else (e.g. a vLLM server) may be listening on this port
+            if model_path not in models:
+                raise RuntimeError(
+                    f"The server at {api_base} serves {models}, not {model_path}. "
+                    "Stop it or pass another api_base."
+                )
+            logger.info(f"Reusing running llama.cpp server at {api_base}")
+        else:
+            url = urlparse(api_base)
+            port = url.port or 8080
+            command = [
+                sys.executable,
+                "-m",
+                "llama_cpp.server",
+                "--model",
+                model_path,
+                "--host",
+                url.hostname or "localhost",
+                "--port",
+                str(port),
+                "--n_gpu_layers",
+                str(n_gpu_layers),
+                "--n_ctx",
+                "4096",
+                "--n_threads",
+                str(default_n_threads()),
+                "--n_batch",
+                "2048",
+            ]
+            log_path = Path(tempfile.gettempdir()) / f"llama_cpp_server_{port}.log"
+            logger.info(f"Starting llama.cpp server: {' '.join(command)} (log: {log_path})")
+            if sys.platform == "win32":
+                detach = {
+                    "creationflags": subprocess.DETACHED_PROCESS
+                    | subprocess.CREATE_NEW_PROCESS_GROUP
+                }
+            else:
+                detach = {"start_new_session": True}
+            with open(log_path, "ab") as log:
+                process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, **detach)
+
+            deadline = time.monotonic() + startup_timeout
+            while served_models() is None:
+                returncode = process.poll()
+                if returncode is not None:
+                    raise RuntimeError(
+                        f"llama.cpp server exited with code {returncode} during startup "
+                        f"(is llama-cpp-python[server] installed?). See {log_path}"
+                    )
+                if time.monotonic() > deadline:
+                    raise RuntimeError(
+                        f"llama.cpp server did not start at {api_base}. See {log_path}"
+                    )
+                time.sleep(1.0)
+            logger.info("llama.cpp server ready")
+
+        # llama-cpp-python's server takes the schema in its own json_object form
+        kwargs.setdefault("schema_format", "json_object")
+        return cls(model_path=model_path, n_gpu_layers=n_gpu_layers, api_base=api_base, **kwargs)
 
     def generate(
         self,
@@ -102,6 +375,9 @@ class LLMClient:
         tools: list[ToolSchema] | None = None,
         temperature: float | None = None,
         system_prompt: str | None = None,
+        stop_after_json: bool = False,
+        json_after: str | None = None,
+        json_schema: dict | None = None,
     ) -> dict:
         """
         Generate a response from the LLM.
@@ -111,6 +387,14 @@ class LLMClient:
             tools: Optional list of tools the LLM can call
             temperature: Optional temperature override
             system_prompt: Optional system prompt (sent as system message in chat)
+            stop_after_json: Stream the response and stop generating as soon as
+                the first JSON object is complete, instead of decoding up to
+                max_tokens of trailing text
+            json_after: With stop_after_json, only watch for the JSON object
+                after this marker (e.g. "ACTION:" when the model thinks first)
+            json_schema: JSON schema the response must match. Decoding is
+                constrained to it (a grammar in llama.cpp, guided decoding in
+                vLLM), so the output always parses
 
         Returns:
             Dictionary with:
@@ -119,22 +403,35 @@ class LLMClient:
                 - tokens_used: Number of tokens generated
                 - finish_reason: Why generation stopped
         """
-        if not self.llm:
+        if not self.is_available():
             raise RuntimeError("Model not loaded")
 
         try:
             messages: list[dict[str, str]] = []
+            # Keep the system prompt first and unchanged between calls: llama.cpp
+            # reuses the KV cache for the matching prefix of the previous prompt,
+            # and vLLM's prefix cache does the same across requests.
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
 
-            response = self.llm.create_chat_completion(
-                messages=messages,
-                temperature=temperature or self.temperature,
-                max_tokens=self.max_tokens,
-                top_p=self.top_p,
-                top_k=self.top_k,
-            )
+            if self.session is not None:
+                # The server batches concurrent requests itself
+                if stop_after_json:
+                    return self._generate_json(
+                        messages, temperature, tools, json_after, json_schema
+                    )
+                response = self._create_remote_chat_completion(messages, temperature, json_schema)
+            else:
+                # One Llama context can only run one generation at a time
+                with self._llm_lock:
+                    if stop_after_json:
+                        return self._generate_json(
+                            messages, temperature, tools, json_after, json_schema
+                        )
+                    response = self.llm.create_chat_completion(
+                        messages=messages, **self._completion_params(temperature, json_schema)
+                    )
 
             resp = cast(dict[str, Any], response)
             text = resp["choices"][0]["message"]["content"] or ""
@@ -163,6 +460,120 @@ class LLMClient:
                 "error": str(e),
             }
 
+    def _generate_json(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None,
+        tools: list[ToolSchema] | None,
+        json_after: str | None = None,
+        json_schema: dict | None = None,
+    ) -> dict:
+        """Stream a response and cut it off once the first JSON object closes."""
+        tracker = JsonObjectTracker(after=json_after)
+        parts: list[str] = []
+        tokens_used = 0
+        finish_reason = "length"
+
+        stream = self._stream_chat_completion(messages, temperature, json_schema)
+        try:
+            for delta in stream:
+                parts.append(delta)
+                tokens_used += 1
+                if tracker.feed(delta):
+                    finish_reason = "stop"
+                    break
+        finally:
+            # Closing the generator stops llama.cpp decoding / the server request
+            stream.close()
+
+        text = "".join(parts)
+        return {
+            "text": text,
+            "tool_call": self._parse_tool_call(text) if tools and text else None,
+            "tokens_used": tokens_used,
+            "finish_reason": finish_reason,
+        }
+
+    def _completion_params(
+        self, temperature: float | None, json_schema: dict | None
+    ) -> dict[str, Any]:
+        """Sampling parameters shared by the local and server backends."""
+        params: dict[str, Any] = {
+            "temperature": temperature or self.temperature,
+            "max_tokens": self.max_tokens,
+            "top_p": self.top_p,
+            "top_k": self.top_k,
+        }
+        if json_schema is not None:
+            if self.session is None or self.schema_format == "json_object":
+                # llama-cpp-python (in-process or its server) compiles the schema
+                # into a GBNF grammar
+                params["response_format"] = {"type": "json_object", "schema": json_schema}
+            else:
+                # OpenAI structured outputs; vLLM enforces them with guided decoding
+                params["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": {"name": "response", "schema": json_schema},
+                }
+        return params
+
+    def _stream_chat_completion(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None,
+        json_schema: dict | None = None,
+    ) -> Iterator[str]:
+        """Yield the text deltas of a streamed chat completion (one per token)."""
+        params = self._completion_params(temperature, json_schema)
+        if self.session is None:
+            chunks = self.llm.create_chat_completion(messages=messages, stream=True, **params)
+            for chunk in chunks:
+                delta = chunk["choices"][0]["delta"].get("content")
+                if delta:
+                    yield delta
+            return
+
+        with self.session.post(
+            f"{self.api_base}/chat/completions",
+            json={"model": self.model_path, "messages": messages, "stream": True, **params},
+            timeout=120,
+            stream=True,
+        ) as http_response:
+            http_response.raise_for_status()
+            # Server-sent events: "data: {...}" lines, terminated by "data: [DONE]"
+            for line in http_response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                data = line[len("data: ") :]
+                if data == "[DONE]":
+                    break
+                delta = json.loads(data)["choices"][0]["delta"].get("content")
+                if delta:
+                    yield delta
+
+    def _create_remote_chat_completion(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None,
+        json_schema: dict | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send a chat completion request to the OpenAI-compatible server.
+
+        The response has the same shape as llama-cpp's create_chat_completion.
+        """
+        http_response = self.session.post(
+            f"{self.api_base}/chat/completions",
+            json={
+                "model": self.model_path,
+                "messages": messages,
+                **self._completion_params(temperature, json_schema),
+            },
+            timeout=120,
+        )
+        http_response.raise_for_status()
+        return http_response.json()
+
     def _parse_tool_call(self, text: str) -> dict | None:
         """
         Parse tool call from LLM response.
@@ -190,16 +601,33 @@ class LLMClient:
             return None
 
         except Exception as e:
-            logger.debug(f"Could not parse tool call: {e}")
+            logger.debug("Could not parse tool call: %s", e)
             return None
 
     def is_available(self) -> bool:
         """Check if the LLM backend is ready."""
-        return self.llm is not None
+        return self.llm is not None or self.session is not None
 
     def unload(self) -> None:
-        """Unload the model and free resources."""
-        if self.llm:
-            del self.llm
-            self.llm = None
-            logger.info("Model unloaded")
+        """
+        Unload the model and free resources.
+
+        For server-backed clients this only closes the connection; the server
+        (and the model it holds) keeps running. Safe to call more than once;
+        a local model is freed only after any running generation finishes.
+        """
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+            logger.info("Server connection closed")
+        with self._llm_lock:
+            if self.llm is not None:
+                del self.llm
+                self.llm = None
+                logger.info("Model unloaded")
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.unload()
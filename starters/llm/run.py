@@ -14,6 +14,12 @@ Usage:
     # With custom model
     python run.py --model path/to/model.gguf
 
+    # With a vLLM server (see python/run_vllm_server.py)
+    python run.py --backend vllm --model meta-llama/Llama-2-7b-chat-hf
+
+    # Keep the model loaded between runs (starts a llama.cpp server on first use)
+    python run.py --backend llama_cpp_server
+
 Then launch Agent Arena, connect to localhost:5000, and run a scenario.
 """
 
@@ -21,6 +27,7 @@ import argparse
 import logging
 from agent_arena_sdk import AgentArena
 from agent import Agent
+from llm_client import LLMClient
 
 # Setup logging
 logging.basicConfig(
@@ -37,22 +44,89 @@ def main():
         "--model",
         type=str,
         default="models/llama-2-7b/gguf/q4/model.gguf",
-        help="Path to GGUF model file",
+        help="Path to GGUF model file (or served model name with --backend vllm)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["llama_cpp", "llama_cpp_server", "vllm"],
+        default="llama_cpp",
+        help=(
+            "Load the model in-process (llama_cpp), in a persistent background "
+            "llama.cpp server reused across runs (llama_cpp_server), "
+            "or use a vLLM server (vllm)"
+        ),
+    )
+    parser.add_argument(
+        "--api-base",
+        type=str,
+        default=None,
+        help=(
+            "Server URL (default: http://localhost:8000/v1 for --backend vllm, "
+            "http://localhost:8080/v1 for llama_cpp_server)"
+        ),
+    )
+    parser.add_argument(
+        "--flash-attn",
+        action="store_true",
+        help="Use flash attention (faster on GPUs with tensor cores, needs a CUDA build)",
+    )
+    parser.add_argument(
+        "--kv-cache-type",
+        choices=["f16", "q8_0", "q4_0"],
+        default="f16",
+        help="KV cache precision for llama_cpp; q8_0 halves its VRAM (quantizes "
+        "values too when combined with --flash-attn)",
+    )
+    parser.add_argument(
+        "--prompt-lookup",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Speculative decoding for llama_cpp: draft N tokens per step from "
+        "matching prompt text (try 10; default: off)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Agents decided concurrently per tick (default: 8 with --backend vllm, "
+            "which batches concurrent requests on the GPU; 1 otherwise, since "
+            "llama.cpp runs one generation at a time)"
+        ),
     )
     parser.add_argument("--port", type=int, default=5000, help="Port to listen on")
 
     args = parser.parse_args()
+    if args.workers is None:
+        args.workers = 8 if args.backend == "vllm" else 1
 
     logger.info("=" * 60)
     logger.info("Starting LLM Agent...")
     logger.info(f"Model: {args.model}")
+    logger.info(f"Backend: {args.backend} ({args.workers} concurrent decisions)")
     logger.info("Features: LLM Reasoning + Memory")
     logger.info("=" * 60)
     logger.info("Loading model (this may take a minute)...")
 
+    agent = None
     try:
         # Create agent (loads LLM)
-        agent = Agent(model_path=args.model)
+        if args.backend == "llama_cpp_server":
+            server = {"api_base": args.api_base} if args.api_base else {}
+            client = LLMClient.connect_or_spawn(args.model, **server)
+            agent = Agent(model_path=args.model, llm_client=client)
+        else:
+            api_base = None
+            if args.backend == "vllm":
+                api_base = args.api_base or "http://localhost:8000/v1"
+            agent = Agent(
+                model_path=args.model,
+                api_base=api_base,
+                flash_attn=args.flash_attn,
+                kv_cache_type=args.kv_cache_type,
+                prompt_lookup_tokens=args.prompt_lookup,
+            )
 
         logger.info("=" * 60)
         logger.info("Model loaded! Waiting for connection from Agent Arena game...")
@@ -60,7 +134,7 @@ def main():
         logger.info("=" * 60)
 
         # Create arena connection
-        arena = AgentArena(host="127.0.0.1", port=args.port)
+        arena = AgentArena(host="127.0.0.1", port=args.port, max_workers=args.workers)
 
         # Run agent (blocks until Ctrl+C)
         arena.run(agent.decide)
@@ -71,7 +145,7 @@ def main():
         logger.error(f"Error: {e}", exc_info=True)
     finally:
         # Unload model
-        if "agent" in locals():
+        if agent is not None:
             logger.info("Unloading model...")
             agent.llm.unload()
 
@@ -5,10 +5,11 @@ Unit tests for LongTermMemory implementation.
 import tempfile
 from pathlib import Path
 
+import faiss
 import numpy as np
 import pytest
 
-from long_term_memory_module.long_term_memory import LongTermMemory
+from long_term_memory_module.long_term_memory import LongTermMemory, _score_and_filter
 
 
 class TestLongTermMemoryInitialization:
@@ -48,6 +49,16 @@ class TestLongTermMemoryInitialization:
         memory = LongTermMemory(persist_path="./data/test.faiss")
         assert memory.persist_path == "./data/test.faiss"
 
+    @pytest.mark.skipif(hasattr(faiss, "StandardGpuResources"), reason="faiss-gpu is installed")
+    def test_use_gpu_falls_back_to_cpu(self):
+        """Test that use_gpu degrades to a working CPU index without faiss-gpu."""
+        memory = LongTermMemory(use_gpu=True)
+        assert memory.use_gpu is False
+
+        memory.store_memory("Found berries near the forest.")
+        results = memory.query_memory("berries", k=1)
+        assert len(results) == 1
+
 
 class TestLongTermMemoryStorage:
     """Tests for storing memories."""
@@ -211,6 +222,23 @@ class TestLongTermMemoryRetrieval:
         for result in results:
             assert result["score"] >= 0.3
 
+    def test_query_batch_matches_single_queries(self, populated_memory):
+        """Test batched queries return the same hits as individual queries."""
+        queries = ["Where can I find berries?", "water", "fire hazard"]
+        batched = populated_memory.query_memory_batch(queries, k=2)
+
+        assert len(batched) == len(queries)
+        for query, results in zip(queries, batched):
+            single = populated_memory.query_memory(query, k=2)
+            assert [r["id"] for r in results] == [r["id"] for r in single]
+            assert [r["score"] for r in results] == pytest.approx([r["score"] for r in single])
+
+    def test_query_batch_empty_inputs(self):
+        """Test batched queries with no queries or no memories."""
+        memory = LongTermMemory()
+        assert memory.query_memory_batch([]) == []
+        assert memory.query_memory_batch(["a", "b"]) == [[], []]
+
     def test_recall_by_id(self, populated_memory):
         """Test retrieving memory by ID."""
         # Get an ID from stored memories
@@ -276,6 +304,26 @@ class TestLongTermMemoryPersistence:
         # Check that files were created
         assert Path(temp_dir / "test_memory.index").exists()
         assert Path(temp_dir / "test_memory.metadata").exists()
+        assert Path(temp_dir / "test_memory.embs.npy").exists()
+
+    def test_load_uses_saved_embeddings(self, temp_dir):
+        """Test that load memory-maps saved embeddings instead of re-encoding."""
+        filepath = str(temp_dir / "test_memory.faiss")
+
+        memory = LongTermMemory(persist_path=filepath)
+        memory_id = memory.store_memory("Berries grow near the river bank.")
+        memory.save()
+
+        loaded = LongTermMemory(persist_path=filepath)
+        loaded.encoder.encode = None  # Any re-encoding attempt would fail
+        loaded.load()
+
+        np.testing.assert_array_equal(
+            loaded.memories[memory_id]["embedding"], memory.memories[memory_id]["embedding"]
+        )
+
+        # Saving back over the memory-mapped file must work
+        loaded.save()
 
     def test_save_without_path_raises_error(self):
         """Test that save without filepath raises error."""
@@ -408,6 +456,17 @@ class TestLongTermMemoryIndexTypes:
         assert results[0]["score"] >= -1.0
         assert results[0]["score"] <= 1.0
 
+    def test_flat_ip_embeddings_are_normalized(self):
+        """Test FlatIP stores unit-length embeddings so IP equals cosine."""
+        memory = LongTermMemory(index_type="FlatIP")
+        memory_id = memory.store_memory("Berries grow near the river bank.")
+
+        embedding = memory.memories[memory_id]["embedding"]
+        assert np.linalg.norm(embedding) == pytest.approx(1.0, abs=1e-5)
+
+        results = memory.query_memory("Berries grow near the river bank.", k=1)
+        assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
+
     def test_ivf_index(self):
         """Test IVF index for approximate search."""
         memory = LongTermMemory(index_type="IVF50")
@@ -419,6 +478,62 @@ class TestLongTermMemoryIndexTypes:
         results = memory.query_memory("unique content", k=5)
         assert len(results) == 5
 
+    def test_autotune_ivf_index(self, tmp_path):
+        """Test autotune picks an nprobe and persists it across save/load."""
+        memory = LongTermMemory(index_type="IVF10")
+        for i in range(60):
+            memory.store_memory(f"Memory number {i} about item {i % 7} in zone {i % 5}.")
+
+        queries = memory.encoder.encode(
+            ["item 3 in zone 2", "memory number 10", "zone 4"], convert_to_numpy=True
+        )
+        key = memory.autotune(queries, target_recall=0.9)
+        assert key.startswith("nprobe=")
+        assert memory.search_params == key
+
+        memory.save(str(tmp_path / "tuned.faiss"))
+        loaded = LongTermMemory(index_type="IVF10")
+        loaded.load(str(tmp_path / "tuned.faiss"))
+        assert loaded.search_params == key
+        assert f"nprobe={loaded.index.nprobe}" == key
+
+    def test_autotune_flat_index_is_noop(self):
+        """Test autotune on an exact index has nothing to tune."""
+        memory = LongTermMemory(index_type="Flat")
+        memory.store_memory("Test memory")
+
+        queries = memory.encoder.encode(["test"], convert_to_numpy=True)
+        assert memory.autotune(queries) == ""
+        assert memory.search_params is None
+
+    def test_autotune_empty_index_raises(self):
+        """Test autotune requires stored memories."""
+        memory = LongTermMemory(index_type="IVF10")
+        with pytest.raises(ValueError, match="empty index"):
+            memory.autotune(np.zeros((1, memory.embedding_dim), dtype=np.float32))
+
+
+class TestScoreAndFilter:
+    """Tests for the vectorized distance-to-score helper."""
+
+    def test_l2_distances_are_inverted(self):
+        """Test L2 distances become 1 / (1 + d) scores."""
+        distances = np.array([0.0, 1.0, 3.0], dtype=np.float32)
+        indices = np.array([2, 0, 1], dtype=np.int64)
+
+        scores, valid = _score_and_filter(distances, indices, is_ip=False, threshold=None)
+        np.testing.assert_allclose(scores, [1.0, 0.5, 0.25])
+        assert valid.tolist() == [True, True, True]
+
+    def test_ip_scores_and_threshold(self):
+        """Test IP distances pass through and threshold/-1 ids are masked out."""
+        distances = np.array([0.9, 0.4, 0.2], dtype=np.float32)
+        indices = np.array([1, 0, -1], dtype=np.int64)
+
+        scores, valid = _score_and_filter(distances, indices, is_ip=True, threshold=0.5)
+        np.testing.assert_allclose(scores, distances)
+        assert valid.tolist() == [True, False, False]
+
 
 class TestLongTermMemoryEdgeCases:
     """Tests for edge cases and error conditions."""
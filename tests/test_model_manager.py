@@ -166,6 +166,19 @@ class TestModelManager:
         path = model_manager.get_model_path("nonexistent", "gguf", "q4_k_m")
         assert path is None
 
+    def test_select_quantization(self, model_manager, temp_dir):
+        """Test picking the largest quantization that fits in free VRAM."""
+        for quant, size in [("q4_k_m", 400), ("q8_0", 800), ("f16", 1600)]:
+            quant_dir = temp_dir / "models" / "test-model" / "gguf" / quant
+            quant_dir.mkdir(parents=True)
+            (quant_dir / f"model.{quant}.gguf").write_bytes(b"0" * size)
+
+        assert model_manager.select_quantization("test-model", 1000)["quantization"] == "q8_0"
+        assert model_manager.select_quantization("test-model", 4000)["quantization"] == "f16"
+        # Nothing fits: fall back to the smallest
+        assert model_manager.select_quantization("test-model", 100)["quantization"] == "q4_k_m"
+        assert model_manager.select_quantization("missing-model", 4000) is None
+
     def test_remove_model_not_found(self, model_manager):
         """Test remove_model with non-existent model."""
         assert not model_manager.remove_model("nonexistent")
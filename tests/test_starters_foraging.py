@@ -629,6 +629,243 @@ class TestLLMStarterForaging:
         assert result["params"]["target_position"] == [1, 0, 2]
 
 
+class TestLLMClientServerBackend:
+    """Test the LLM starter client against an OpenAI-compatible (vLLM) server."""
+
+    class _FakeSession:
+        def __init__(self, payload):
+            self.payload = payload
+            self.requests = []
+
+        def post(self, url, json, timeout):
+            self.requests.append((url, json))
+            payload = self.payload
+
+            class _Response:
+                def raise_for_status(self):
+                    pass
+
+                def json(self):
+                    return payload
+
+            return _Response()
+
+        def close(self):
+            pass
+
+    def test_generate_uses_server(self):
+        """Client should post chat completions to api_base instead of loading a model."""
+        from starters.llm.llm_client import LLMClient
+
+        client = LLMClient(model_path="served-model", api_base="http://localhost:8000/v1/")
+        assert client.llm is None
+        assert client.is_available()
+
+        session = self._FakeSession(
+            {
+                "choices": [{"message": {"content": '{"tool": "idle"}'}, "finish_reason": "stop"}],
+                "usage": {"total_tokens": 12},
+            }
+        )
+        client.session = session
+
+        response = client.generate(prompt="What now?", system_prompt="You forage.")
+
+        assert response["text"] == '{"tool": "idle"}'
+        assert response["tokens_used"] == 12
+        url, body = session.requests[0]
+        assert url == "http://localhost:8000/v1/chat/completions"
+        assert body["model"] == "served-model"
+        assert [m["role"] for m in body["messages"]] == ["system", "user"]
+
+        client.unload()
+        assert not client.is_available()
+
+    def test_stop_after_json_stops_decoding(self):
+        """Streaming generation should stop as soon as the JSON object closes."""
+        from starters.llm.llm_client import LLMClient
+
+        pieces = ['{"tool": "idle", ', '"reasoning": "wait {here}"', "}", "\n\nExtra", " text"]
+        consumed = []
+
+        class _FakeLlama:
+            def create_chat_completion(self, **kwargs):
+                assert kwargs["stream"] is True
+                for piece in pieces:
+                    consumed.append(piece)
+                    yield {"choices": [{"delta": {"content": piece}}]}
+
+        client = LLMClient(model_path="served-model", api_base="http://localhost:8000/v1")
+        client.session = None
+        client.llm = _FakeLlama()
+
+        response = client.generate(prompt="What now?", stop_after_json=True)
+
+        assert response["text"] == '{"tool": "idle", "reasoning": "wait {here}"}'
+        assert response["finish_reason"] == "stop"
+        assert response["tokens_used"] == 3
+        assert len(consumed) == 3
+
+    def test_json_schema_sent_as_response_format(self):
+        """A JSON schema should reach the server as a structured-output constraint."""
+        from starters.llm.llm_client import LLMClient
+
+        client = LLMClient(model_path="served-model", api_base="http://localhost:8000/v1")
+        session = self._FakeSession(
+            {
+                "choices": [{"message": {"content": '{"tool": "idle"}'}, "finish_reason": "stop"}],
+                "usage": {"total_tokens": 5},
+            }
+        )
+        client.session = session
+        schema = {"type": "object", "properties": {"tool": {"enum": ["idle"]}}}
+
+        client.generate(prompt="What now?", json_schema=schema)
+
+        _, body = session.requests[0]
+        assert body["response_format"]["type"] == "json_schema"
+        assert body["response_format"]["json_schema"]["schema"] == schema
+
+    def test_json_schema_for_llama_cpp_server(self, monkeypatch):
+        """A llama.cpp server should get the schema in its json_object form."""
+        import requests
+
+        from starters.llm.llm_client import LLMClient
+
+        class _Ok:
+            ok = True
+
+            def json(self):
+                return {"data": [{"id": "model.gguf"}]}
+
+        monkeypatch.setattr(requests, "get", lambda url, timeout: _Ok())
+        client = LLMClient.connect_or_spawn("model.gguf", api_base="http://localhost:8080/v1")
+        session = self._FakeSession(
+            {
+                "choices": [{"message": {"content": '{"tool": "idle"}'}, "finish_reason": "stop"}],
+                "usage": {"total_tokens": 5},
+            }
+        )
+        client.session = session
+        schema = {"type": "object", "properties": {"tool": {"enum": ["idle"]}}}
+
+        client.generate(prompt="What now?", json_schema=schema)
+
+        _, body = session.requests[0]
+        assert body["response_format"] == {"type": "json_object", "schema": schema}
+
+    def test_json_tracker_waits_for_marker(self):
+        """Braces in chain-of-thought text before the marker should be ignored."""
+        from starters.llm.llm_client import JsonObjectTracker
+
+        tracker = JsonObjectTracker(after="ACTION:")
+        assert not tracker.feed("THINKING: berries at {1, 2} look close. ACT")
+        assert not tracker.feed('ion: {"tool": "move_to", "params": {"target_position": [1')
+        assert tracker.feed(", 0, 2]}}\n")
+
+    def test_unload_is_idempotent(self):
+        """Unloading twice (e.g. via a with block and a finally) should be safe."""
+        from starters.llm.llm_client import LLMClient
+
+        with LLMClient(model_path="served-model", api_base="http://localhost:8000/v1") as client:
+            assert client.is_available()
+        assert not client.is_available()
+        client.unload()
+
+    def test_old_llama_cpp_loads_defaults_and_explains_options(self, monkeypatch):
+        """An old llama-cpp-python should load with defaults and name the fix otherwise."""
+        import types
+
+        from starters.llm.llm_client import LLMClient
+
+        class _OldLlama:
+            def __init__(
+                self, model_path, n_ctx, n_threads, n_threads_batch, n_batch, n_gpu_layers, verbose
+            ):
+                self.model_path = model_path
+
+        old = types.ModuleType("llama_cpp")
+        old.__version__ = "0.2.20"
+        old.Llama = _OldLlama
+        monkeypatch.setitem(sys.modules, "llama_cpp", old)
+
+        client = LLMClient(model_path="model.gguf")
+        assert isinstance(client.llm, _OldLlama)
+
+        with pytest.raises(RuntimeError, match="0.2.20 is too old"):
+            LLMClient(model_path="model.gguf", flash_attn=True)
+
+    def test_connect_or_spawn_reuses_running_server(self, monkeypatch):
+        """A server that already answers should be reused without starting another."""
+        import subprocess
+
+        import requests
+
+        from starters.llm.llm_client import LLMClient
+
+        class _Ok:
+            ok = True
+
+            def json(self):
+                return {"data": [{"id": "model.gguf"}]}
+
+        def fail_popen(*args, **kwargs):
+            raise AssertionError("server should not be spawned")
+
+        monkeypatch.setattr(requests, "get", lambda url, timeout: _Ok())
+        monkeypatch.setattr(subprocess, "Popen", fail_popen)
+
+        client = LLMClient.connect_or_spawn("model.gguf", api_base="http://localhost:8080/v1")
+
+        assert client.api_base == "http://localhost:8080/v1"
+        assert client.is_available()
+
+    def test_connect_or_spawn_rejects_other_model(self, monkeypatch):
+        """A server on the port that serves another model (e.g. vLLM) is not reused."""
+        import requests
+
+        from starters.llm.llm_client import LLMClient
+
+        class _Vllm:
+            ok = True
+
+            def json(self):
+                return {"data": [{"id": "meta-llama/Llama-2-7b-chat-hf"}]}
+
+        monkeypatch.setattr(requests, "get", lambda url, timeout: _Vllm())
+
+        with pytest.raises(RuntimeError, match="not model.gguf"):
+            LLMClient.connect_or_spawn("model.gguf", api_base="http://localhost:8000/v1")
+
+    def test_connect_or_spawn_reports_early_exit(self, monkeypatch, tmp_path):
+        """A server that dies during startup fails fast and points at its log."""
+        import subprocess
+        import tempfile
+
+        import requests
+
+        from starters.llm.llm_client import LLMClient
+
+        def refuse(url, timeout):
+            raise requests.ConnectionError("refused")
+
+        class _Exited:
+            def __init__(self, command, stdout, stderr, **kwargs):
+                stdout.write(b"No module named 'uvicorn'\n")
+
+            def poll(self):
+                return 1
+
+        monkeypatch.setattr(requests, "get", refuse)
+        monkeypatch.setattr(subprocess, "Popen", _Exited)
+        monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+
+        with pytest.raises(RuntimeError, match="exited with code 1"):
+            LLMClient.connect_or_spawn("model.gguf", api_base="http://localhost:8080/v1")
+        log = tmp_path / "llama_cpp_server_8080.log"
+        assert "uvicorn" in log.read_text()
+
+
 # ------------------------------------------------------------------ #
 #  Sliding Window Memory Tests (used by intermediate and LLM starters)
 # ------------------------------------------------------------------ #
@@ -161,6 +161,31 @@ def test_export_schemas_json():
     assert "First tool" in json_str
 
 
+def test_export_schemas_json_refreshes_on_change():
+    """Test that the cached schema JSON follows registrations."""
+    dispatcher = ToolDispatcher()
+    dispatcher.register_tool(
+        name="tool1",
+        function=dummy_tool,
+        description="First tool",
+        parameters={"type": "object"},
+        returns={"type": "integer"},
+    )
+    assert dispatcher.export_schemas_json() is dispatcher.export_schemas_json()
+
+    dispatcher.register_tool(
+        name="tool2",
+        function=dummy_tool,
+        description="Second tool",
+        parameters={"type": "object"},
+        returns={"type": "string"},
+    )
+    assert "tool2" in dispatcher.export_schemas_json()
+
+    dispatcher.unregister_tool("tool1")
+    assert "tool1" not in dispatcher.export_schemas_json()
+
+
 def test_tool_error_handling():
     """Test error handling in tool execution."""
 